@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from pyturbo.ports.fluid_port import FluidPort
-from pyturbo.ports.frame_port import FramePort
+from pyturbo.ports.frame_port import Frame, FramePort
 from pyturbo.ports.keypoints_port import KeypointsPort
 from pyturbo.ports.shaft_port import ShaftPort
 from pyturbo.ports.view_port import View, ViewPort
@@ -12,6 +12,7 @@ __all__ = [
     "ShaftPort",
     "KeypointsPort",
     "FramePort",
+    "Frame",
     "ViewPort",
     "View",
 ]
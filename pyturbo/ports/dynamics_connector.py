@@ -1,53 +1,85 @@
 # Copyright (C) 2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Any
+
 from cosapp.base import BaseConnector
 from cosapp.ports import Port
 
 
 class DynamicsConnector(BaseConnector):
-    """Custom connector with automatic transformation between coordinate systems."""
+    """Custom connector with automatic transformation between coordinate systems.
+
+    The frame transformations to apply are resolved by `compile`, on the first transfer, and
+    stored as a plan of frame ports. It must be compiled again if frame ports are added to the
+    systems after a first transfer.
+    """
 
     def __init__(self, name: str, sink: Port, source: Port, *args, **kwargs):
         super().__init__(name, sink, source)
+        self._plan = None
+
+    def compile(self) -> list:
+        """Resolve the frame transformations of the transfer.
+
+        Returns
+        -------
+        plan : list[tuple[Port, bool]]
+            The frame ports to apply in order, with whether the frame change is inverted.
+        """
+        sink = self.sink.owner
+        source = self.source.owner
+        plan = []
+
+        def add(parent, child, inverse):
+            frame_name = f"{child.name}_frame"
+            if parent is not None and frame_name in parent:
+                plan.append((parent[frame_name], inverse))
+
+        # source(parent) --> sink(child)
+        if sink.parent is source:
+            add(source, sink, True)
+
+        # source(child) --> sink(parent)
+        if source.parent is sink:
+            add(sink, source, False)
+
+        # source(child) --> sink(child)
+        if sink.parent is source.parent:
+            add(sink.parent, source, False)
+            add(sink.parent, sink, True)
+
+        self._plan = plan
+        return plan
 
     def transfer(self) -> None:
+        plan = self._plan
+        if plan is None:
+            plan = self.compile()
 
         sink = self.sink
         source = self.source
 
         # Implement: sink.target = source.origin
-        for target, origin in self.mapping.items():
+        for target, origin in self._mapping.items():
             setattr(sink, target, getattr(source, origin))
 
-        # source(parent) --> sink(child)
-        if sink.owner.parent == source.owner:
-            parent = source.owner
-
-            frame_name = f"{sink.owner.name}_frame"
-            if frame_name in parent:
-                frame = parent[frame_name].get_value()
-                sink.set_value(source.get_value().change_to_frame(frame))
-
-        # source(child) --> sink(parent)
-        if sink.owner == source.owner.parent:
-            parent = sink.owner
+        if plan:
+            value = source.get_value()
+            for port, inverse in plan:
+                frame = port.get_value()
+                if inverse:
+                    value = value.change_to_frame(frame)
+                else:
+                    value = value.change_from_frame(frame)
+            sink.set_value(value)
 
-            frame_name = f"{source.owner.name}_frame"
-            if frame_name in parent:
-                frame = parent[frame_name].get_value()
-                sink.set_value(source.get_value().change_from_frame(frame))
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_plan"] = None
+        return state
 
-        # source(child) --> sink(child)
-        if sink.owner.parent == source.owner.parent:
-            parent = sink.owner.parent
-
-            frame_name = f"{source.owner.name}_frame"
-            if frame_name in parent:
-                frame = parent[frame_name].get_value()
-                sink.set_value(source.get_value().change_from_frame(frame))
-
-            frame_name = f"{sink.owner.name}_frame"
-            if frame_name in parent:
-                frame = parent[frame_name].get_value()
-                sink.set_value(source.get_value().change_to_frame(frame))
+    def __json__(self) -> dict[str, Any]:
+        state = super().__json__()
+        state.pop("_plan", None)
+        return state
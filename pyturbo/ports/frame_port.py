@@ -38,11 +38,7 @@ class FramePort(Port):
         frame: Frame
             The Frame object with the values of the port.
         """
-        frame = Frame()
-
-        frame.position = self.position
-        frame.angle = self.angle
-        return frame
+        return Frame(self.position, self.angle)
 
     def set_value(self, other):
         """Set the values stored in the port from a `Frame` or `FramePort` object.
@@ -74,17 +70,73 @@ class FramePort(Port):
 class Frame:
     """Frame class to handle frame in 3D space.
 
+    The transformation is stored either as position and rotation vector, or as a 4x4 homogeneous
+    matrix, the other representation being computed on demand and cached. Composition and
+    inversion are done with matrix products.
+
+    Parameters
+    ----------
+    position[m] : np.array, optional
+        Position of analysis, zero by default.
+    angle[rad] : np.array, optional
+        Rotation vector, zero by default.
+
     Attributes
     ----------
     position[m] : np.array
         Position of analysis.
     angle[rad] : np.array
         Rotation vector.
+    matrix : np.array
+        Homogeneous transformation matrix, from the frame to the reference frame.
     """
 
-    def __init__(self):
-        self.position: np.ndarray = np.r_[0.0, 0.0, 0.0]
-        self.angle: np.ndarray = np.r_[0.0, 0.0, 0.0]  # radian
+    def __init__(self, position=None, angle=None):
+        self._position = np.zeros(3) if position is None else np.array(position, dtype=float)
+        self._angle = np.zeros(3) if angle is None else np.array(angle, dtype=float)
+        self._matrix = None
+
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray) -> "Frame":
+        """Create a frame from a 4x4 homogeneous transformation matrix."""
+        frame = cls.__new__(cls)
+        frame._position = None
+        frame._angle = None
+        frame._matrix = matrix
+        return frame
+
+    @property
+    def position(self) -> np.ndarray:
+        if self._position is None:
+            self._position = self._matrix[:3, 3].copy()
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._angle = self.angle
+        self._position = np.array(value, dtype=float)
+        self._matrix = None
+
+    @property
+    def angle(self) -> np.ndarray:
+        if self._angle is None:
+            self._angle = R.from_matrix(self._matrix[:3, :3]).as_rotvec()
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        self._position = self.position
+        self._angle = np.array(value, dtype=float)
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            matrix = np.eye(4)
+            matrix[:3, :3] = rotation_matrix(self._angle)
+            matrix[:3, 3] = self._position
+            self._matrix = matrix
+        return self._matrix
 
     def change_from_frame(self, frame):
         """Change the values of other from one frame to frame.
@@ -99,12 +151,7 @@ class Frame:
         frame: Frame
             The new object with values transported from `frame` to base frame.
         """
-        new_frame = Frame()
-        rot_frame = R.from_rotvec(frame.angle)
-
-        new_frame.position = frame.position + rot_frame.apply(self.position)
-        new_frame.angle = R.as_rotvec(R.from_rotvec(self.angle) * R.from_rotvec(frame.angle))
-        return new_frame
+        return Frame.from_matrix(frame.matrix @ self.matrix)
 
     def change_to_frame(self, frame):
         """Change other coordinate from frame self defined in reference frame to reference frame."""
@@ -118,14 +165,65 @@ class Frame:
         inv: Frame
             The inverted frame.
         """
-        inv = Frame()
-        invrot = R.from_rotvec(-self.angle)
+        matrix = self.matrix
+        inv = np.eye(4)
+        inv[:3, :3] = matrix[:3, :3].T
+        inv[:3, 3] = -matrix[:3, :3].T @ matrix[:3, 3]
+
+        frame = Frame.from_matrix(inv)
+        if self._angle is not None:
+            frame._angle = -self._angle
+        return frame
+
+    def apply(self, points) -> np.ndarray:
+        """Transport points from the frame to the reference frame.
+
+        Parameters
+        ----------
+        points[m] : np.array
+            Point or array of points, of shape (..., 3).
+
+        Returns
+        -------
+        points[m] : np.array
+            The transported points, with the same shape.
+        """
+        matrix = self.matrix
+        return np.asarray(points) @ matrix[:3, :3].T + matrix[:3, 3]
+
+    @staticmethod
+    def change_many_from_frame(frames, frame) -> list:
+        """Change the values of several frames from `frame` to base frame at once.
 
-        inv.position = -invrot.apply(self.position)
-        inv.angle = -invrot.apply(self.angle)
+        Parameters
+        ----------
+        frames: list of Frame
+            The frames defined in `frame`.
+        frame: Frame
+            Object contaning information about position and rotation vector of other frame.
 
-        return inv
+        Returns
+        -------
+        frames: list of Frame
+            The new objects with values transported from `frame` to base frame.
+        """
+        if not frames:
+            return []
+        matrices = frame.matrix @ np.stack([f.matrix for f in frames])
+        return [Frame.from_matrix(matrix) for matrix in matrices]
 
     def __repr__(self):
         """Return a string representation."""
         return f"Frame: {self.position}, {self.angle}"
+
+
+def rotation_matrix(vec) -> np.ndarray:
+    """Rotation matrix of the rotation vector `vec`, from the Rodrigues formula."""
+    vec = np.asarray(vec, dtype=float)
+    angle = np.sqrt(vec @ vec)
+    if angle < 1e-12:
+        return np.eye(3)
+
+    x, y, z = vec / angle
+    k = np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+    return np.eye(3) + np.sin(angle) * k + (1.0 - np.cos(angle)) * (k @ k)
@@ -3,7 +3,9 @@
 
 import numpy as np
 from cosapp.ports import Port
-from pyoccad.create import CreateAxis, CreateRevolution, CreateWire
+
+from pyturbo.utils.coords import rz_to_3d
+from pyturbo.utils.shape_cache import cached_shape
 
 
 class KeypointsPort(Port):
@@ -67,24 +69,22 @@ class KeypointsPort(Port):
         return np.mean((self.inlet_hub, self.inlet_tip, self.exit_hub, self.exit_tip), axis=0)[0]
 
     def view(self, shell=False):
-        from pyturbo.utils import rz_to_3d
-
-        if shell:
-            inner = CreateWire.from_points((rz_to_3d(self.inlet_hub), rz_to_3d(self.exit_hub)))
-            outer = CreateWire.from_points((rz_to_3d(self.inlet_tip), rz_to_3d(self.exit_tip)))
-            w = (inner, outer)
-
-            return CreateRevolution.surface_from_curve(inner, CreateAxis.oz())
-
-        else:
-            w = CreateWire.from_points(
-                (
-                    rz_to_3d(self.inlet_hub),
-                    rz_to_3d(self.exit_hub),
-                    rz_to_3d(self.exit_tip),
-                    rz_to_3d(self.inlet_tip),
-                ),
-                auto_close=True,
-            )
-
-            return CreateRevolution.surface_from_curve(w, CreateAxis.oz())
+        return _revolution_view(
+            self.inlet_hub, self.exit_hub, self.exit_tip, self.inlet_tip, shell=shell
+        )
+
+
+@cached_shape
+def _revolution_view(inlet_hub, exit_hub, exit_tip, inlet_tip, shell=False):
+    """Revolution surface of the keypoints, or of the hub line only if `shell`."""
+    from pyoccad.create import CreateAxis, CreateRevolution, CreateWire
+
+    if shell:
+        inner = CreateWire.from_points((rz_to_3d(inlet_hub), rz_to_3d(exit_hub)))
+        return CreateRevolution.surface_from_curve(inner, CreateAxis.oz())
+
+    w = CreateWire.from_points(
+        (rz_to_3d(inlet_hub), rz_to_3d(exit_hub), rz_to_3d(exit_tip), rz_to_3d(inlet_tip)),
+        auto_close=True,
+    )
+    return CreateRevolution.surface_from_curve(w, CreateAxis.oz())
@@ -3,21 +3,22 @@
 
 """Module contaning `ViewPort` and `View` classes."""
 
+import pickle
 from copy import deepcopy
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import numpy as np
 from cosapp.ports import Port
-from pyoccad.create import CreateTopology
-from pyoccad.render import JupyterThreeJSRenderer
-from pyoccad.transform import Rotate, Translate
-from pyoccad.typing import VectorT
 from scipy.spatial.transform import Rotation as R
 
 from pyturbo.ports.dynamics_connector import DynamicsConnector
-from pyturbo.ports.frame_port import Frame
+from pyturbo.ports.frame_port import Frame, rotation_matrix
 from pyturbo.utils.view_tools import create_arrow, create_box, create_sphere, rotate
 
+if TYPE_CHECKING:
+    from pyoccad.typing import VectorT
+
 
 class ViewPort(Port):
     """ViewPort class to handle view in 3D space.
@@ -29,6 +30,7 @@ class ViewPort(Port):
         Each entry is a pair `str: dict`, where the string key is the name of the shape and dict
         contains its information. The information dict has the mandatory `shape` key, storing the
         `pyoccad` object of the component. The other keys refer to rendering options.
+        Shapes are not pickled, but are kept by deep copies.
 
     Example
     -------
@@ -48,6 +50,25 @@ class ViewPort(Port):
 
         pass
 
+    def __reduce_ex__(self, protocol):
+        # shapes are not serialized, they are built again by the next view computation
+        shapes = self.shapes
+        self.shapes = {}
+        try:
+            return super().__reduce_ex__(protocol)
+        finally:
+            self.shapes = shapes
+
+    def __deepcopy__(self, memo):
+        # unlike serialization, deep copies keep the shapes, which are shared as in views
+        for options in self.shapes.values():
+            memo.setdefault(id(options["shape"]), options["shape"])
+
+        cls, args, state = super().__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        port = memo[id(self)] = cls(*args)
+        port.__setstate__(deepcopy(state, memo))
+        return port
+
     def get_value(self):
         """Get the values stored in the port in a `View` object.
 
@@ -129,7 +150,14 @@ class View:
         Dictionary containing the view information (shapes and rendering options).
         Each entry is a pair `str: dict`, where the string key is the name of the shape and dict
         contains its information. The information dict has the mandatory `shape` key, storing the
-        `pyoccad` object of the component. The other keys refer to rendering options.
+        `pyoccad` object of the component. The optional `placement` key stores a 4x4 homogeneous
+        transform still to be applied to the shape. The other keys refer to rendering options.
+
+    Notes
+    -----
+    Shapes are shared between copies and transformed views: transformations only compose the
+    `placement` of the shapes, and shape dicts are never modified in place. Transformed shapes
+    are built by `materialize`, when rendering for instance.
 
     Example
     -------
@@ -166,7 +194,7 @@ class View:
             The color to apply. It can be its html name (ex. `'dodgerblue'`) or its hexadecimal form
             (ex. `'#1E90FF'`).
         """
-        self.shapes[name]["face_color"] = color
+        self.shapes[name] = self.shapes[name] | {"face_color": color}
 
     def copy(self) -> "View":
         """Copy view into another `View` object.
@@ -176,9 +204,56 @@ class View:
         view : View
             The object's copy.
         """
-        view = View()
-        view.shapes = deepcopy(self.shapes)
-        return view
+        return View({name: dict(options) for name, options in self.shapes.items()})
+
+    def get_shape(self, name):
+        """Return the shape `name` with its placement applied.
+
+        Parameters
+        ----------
+        name : str
+            The name of the shape.
+
+        Returns
+        -------
+        shape : pyoccad shape
+            The transformed shape.
+        """
+        options = self.shapes[name]
+        placement = options.get("placement")
+        if placement is None:
+            return options["shape"]
+        return _place(options["shape"], placement)
+
+    def materialize(self) -> "View":
+        """Apply the pending placements to the shapes.
+
+        Returns
+        -------
+        view : View
+            A view with the transformed shapes and without placements.
+        """
+        return View(
+            {
+                name: {k: v for k, v in options.items() if k != "placement"}
+                | {"shape": self.get_shape(name)}
+                for name, options in self.shapes.items()
+            }
+        )
+
+    def _transform(self, matrix: np.ndarray, names=None, inplace=True) -> "View":
+        """Compose the placement of shapes `names` with `matrix`."""
+        names = self._check_names(names)
+        shapes = {
+            name: self.shapes[name]
+            | {"placement": matrix @ self.shapes[name].get("placement", np.eye(4))}
+            for name in names
+        }
+
+        if inplace:
+            self.shapes = self.shapes | shapes
+
+        return View(shapes)
 
     def _check_names(self, names=None):
         """Handle name arguments."""
@@ -194,10 +269,7 @@ class View:
             raise NameError("Only args or kwargs are permitted, not both.")
 
         if kwargs:
-            nd = {}
-            for prefix, view in kwargs.items():
-                for shape in view:
-                    nd[f"{prefix}.{shape}"] = view[shape]
+            nd = self._prefixed(kwargs)
         else:
             nd = {}
             if not self._repeated_names(*args):
@@ -209,15 +281,25 @@ class View:
                     nd[f"{shape}_{i :d}"] = view[shape]
         return nd
 
+    @staticmethod
+    def _prefixed(shapes: dict) -> dict:
+        """Prefix shape names with the keys of `shapes`, a dict of shapes dicts."""
+        return {
+            f"{prefix}.{name}": options
+            for prefix, named in shapes.items()
+            for name, options in named.items()
+        }
+
     def _repeated_names(self, *args):
         """Check whether there are repeated keys in several dicts."""
-        keys = []
+        names = set()
+        size = 0
         for a in args:
-            keys += a.keys()
-        counts = np.unique(keys, return_counts=True)[1]
-        return np.any(counts > 1)
+            names.update(a)
+            size += len(a)
+        return len(names) < size
 
-    def translate(self, vec: VectorT, names=None, inplace=True) -> "View":
+    def translate(self, vec: "VectorT", names=None, inplace=True) -> "View":
         """Translate shapes by a given vectors.
 
         A new object is returned independendly of the value given to the `inplace` parameter. It
@@ -239,18 +321,9 @@ class View:
         view : View
             A view with the translated shapes.
         """
-        names = self._check_names(names)
-        shapes = {key: value for key, value in self.shapes.items() if key in names}
-        for name in names:
-            shapes[name]["shape"] = Translate.from_vector(shapes[name]["shape"], vec, inplace=False)
+        return self._transform(_translation(vec), names, inplace)
 
-        if inplace:
-            for name in names:
-                self.shapes[name] = shapes[name]
-
-        return View(shapes)
-
-    def rotate(self, vec, point: VectorT = (0.0, 0.0, 0.0), names=None, inplace=True) -> "View":
+    def rotate(self, vec, point: "VectorT" = (0.0, 0.0, 0.0), names=None, inplace=True) -> "View":
         """Rotate shapes by a given rotation vector.
 
         A new object is returned independendly of the value given to the `inplace` parameter. It
@@ -274,21 +347,9 @@ class View:
         view : View
             A view with the rotated shapes.
         """
-        names = self._check_names(names)
-
-        point = np.array(point)
-        shapes = self.translate(-point, names, inplace=False).shapes
-        for name in names:
-            angs = R.from_rotvec(vec).as_euler("xyz", False)
-            shapes[name]["shape"] = Rotate.around_x(shapes[name]["shape"], angs[0], inplace=False)
-            shapes[name]["shape"] = Rotate.around_y(shapes[name]["shape"], angs[1], inplace=False)
-            shapes[name]["shape"] = Rotate.around_z(shapes[name]["shape"], angs[2], inplace=False)
-        shapes = self.translate(point, names, inplace=False).shapes
-
-        if inplace:
-            for name in names:
-                self.shapes[name] = shapes[name]
-        return View(shapes)
+        point = np.asarray(point, dtype=float)
+        matrix = _translation(point) @ _rotation(vec) @ _translation(-point)
+        return self._transform(matrix, names, inplace)
 
     def change_from_frame(self, frame: Frame) -> "View":
         """Change the values of View from one frame to objects own frame.
@@ -303,10 +364,7 @@ class View:
         view: View
             The new object with values transported from `frame` to base frame.
         """
-        view = self.copy()
-        view.rotate(frame.angle)
-        view.translate(frame.position)
-        return view
+        return self._transform(frame.matrix, inplace=False)
 
     def change_to_frame(self, frame):
         """Change the values of View base frame to another frame.
@@ -353,6 +411,33 @@ class View:
         else:
             return View(self._handle_repeated_keys(*dicts))
 
+    @classmethod
+    def from_views(cls, views: dict) -> "View":
+        """Merge named views in a single pass.
+
+        The name of every shape is prefixed by the name of its view, so merging views of views
+        gives hierarchical names.
+
+        Parameters
+        ----------
+        views : dict
+            The `View` or `ViewPort` objects to merge, by name.
+
+        Returns
+        -------
+        view : View
+            A view with the shapes of all `views`.
+
+        Examples
+        --------
+        >>> v1 = View({'cyl': {'shape': create_cylinder(1.0, 1.0)}})
+        >>> v2 = View({'cyl': {'shape': create_cylinder(2.0, 2.0)}})
+        >>> v3 = View.from_views({'first': v1, 'second': v2})
+        >>> View.from_views({'module': v3}).shapes.keys()
+        {'module.first.cyl', 'module.second.cyl'}
+        """
+        return cls(cls._prefixed({name: view.shapes for name, view in views.items()}))
+
     def merge_shapes(self, names=None, new_name=None, options=None, inplace=True) -> "View":
         """Merge several OCC shapes into one and save them under a new name.
 
@@ -379,9 +464,13 @@ class View:
             new_options = options
         else:
             new_options = {
-                i: self.shapes[names[0]][i] for i in self.shapes[names[0]] if i != "shape"
+                i: self.shapes[names[0]][i]
+                for i in self.shapes[names[0]]
+                if i not in ("shape", "placement")
             }
-        new_shape = CreateTopology.make_compound(*(self.shapes[name]["shape"] for name in names))
+        from pyoccad.create import CreateTopology
+
+        new_shape = CreateTopology.make_compound(*(self.get_shape(name) for name in names))
         view = View({new_name: {"shape": new_shape, **new_options}})
 
         if inplace:
@@ -390,7 +479,7 @@ class View:
 
         return view
 
-    def add_number(self, number: float, pos: VectorT, name: str = "number", **kwargs):
+    def add_number(self, number: float, pos: "VectorT", name: str = "number", **kwargs):
         """Add the geometrical representation of a number, i.e. a sphere.
 
         Parameters
@@ -532,12 +621,14 @@ class View:
             | kwargs
         )
 
+        from pyoccad.render import JupyterThreeJSRenderer
+
         renderer = JupyterThreeJSRenderer(**options)
         ang = -np.pi / 2.0
         renderer._displayed.rotateX(ang)
         renderer._ax.rotateX(ang)
 
-        for name, dicts in self.shapes.items():
+        for name, dicts in self.materialize().shapes.items():
             shape_opts = {i: dicts[i] for i in dicts if i != "shape"}
             renderer.add_shape(dicts["shape"], uid=name, **shape_opts)
 
@@ -556,7 +647,7 @@ class View:
         renderer : JupyterThreeJSRenderer
             The updated renderer.
         """
-        for name, value in self.shapes.items():
+        for name, value in self.materialize().shapes.items():
             shape = value.pop("shape")
             if name in renderer._mapping.keys():  # updating existant
                 renderer.update_shape(shape, uid=name)
@@ -605,3 +696,28 @@ class View:
         old_name = old_name or list(self.shapes.keys())[0]
         self.shapes = {new_name if k == old_name else k: v for k, v in self.shapes.items()}
         return self
+
+
+def _translation(vec) -> np.ndarray:
+    """Homogeneous matrix of a translation by `vec`."""
+    matrix = np.eye(4)
+    matrix[:3, 3] = vec
+    return matrix
+
+
+def _rotation(vec) -> np.ndarray:
+    """Homogeneous matrix of a rotation by the rotation vector `vec`."""
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation_matrix(vec)
+    return matrix
+
+
+def _place(shape, matrix: np.ndarray):
+    """Return a copy of `shape` transformed by the homogeneous matrix `matrix`."""
+    from pyoccad.transform import Rotate, Translate
+
+    angs = R.from_matrix(matrix[:3, :3]).as_euler("xyz", False)
+    shape = Rotate.around_x(shape, angs[0], inplace=False)
+    shape = Rotate.around_y(shape, angs[1], inplace=False)
+    shape = Rotate.around_z(shape, angs[2], inplace=False)
+    return Translate.from_vector(shape, matrix[:3, 3], inplace=False)
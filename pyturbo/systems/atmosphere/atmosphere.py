@@ -1,10 +1,9 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-import ambiance
 from cosapp.systems import System
 
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas, standard_atmosphere
 
 
 class Atmosphere(System):
@@ -32,7 +31,7 @@ class Atmosphere(System):
     """
 
     def setup(self):
-        self.add_inward("gas", IdealDryAir(), desc="gas model")
+        self.add_inward("gas", shared_gas(IdealDryAir), desc="gas model")
         self.add_inward("altitude", 0.0, unit="m", desc="altitude")
         self.add_inward("mach", 0.0, unit="", desc="Mach number")
         self.add_inward(
@@ -44,9 +43,8 @@ class Atmosphere(System):
         self.add_outward("Tt", 288.15, unit="K", desc="Total temperature")
 
     def compute(self):
-        atm = ambiance.Atmosphere(self.altitude)
-        pamb = atm.pressure[0]
-        tamb = atm.temperature[0] + self.dtamb
+        pamb, tamb = standard_atmosphere().state(self.altitude)
+        tamb += self.dtamb
 
         self.pamb = pamb
         self.Tt = self.gas.total_t(tamb, self.mach)
@@ -1,10 +1,13 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Dict
+
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
+from pyturbo.thermo.ideal_gas import ArrayLike
 
 
 class CombustorAero(System):
@@ -42,7 +45,7 @@ class CombustorAero(System):
 
     def setup(self):
         # properties
-        self.add_inward("gas", IdealDryAir())  # not representing fuel/air mix yet
+        self.add_inward("gas", shared_gas(IdealDryAir))  # not representing fuel/air mix yet
 
         # inputs / outputs
         self.add_input(FluidPort, "fl_in")
@@ -66,3 +69,29 @@ class CombustorAero(System):
         h_out = self.gas.h(self.fl_in.Tt) + self.fuel_W / self.fl_out.W * self.fhv * self.eff
         self.Tcomb = self.gas.t_f_h(h_out, tol=1e-6)
         self.fl_out.Tt = self.Tcomb
+
+    def partials(self) -> Dict[str, Dict[str, ArrayLike]]:
+        """Partial derivatives of outputs with respect to inputs, at the current point.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            derivatives `d[wrt][of]`, outputs not listed do not depend on `wrt`
+        """
+        W, W_out, fuel_W = self.fl_in.W, self.fl_out.W, self.fuel_W
+        q = self.fhv * self.eff
+        cp_out = self.gas.cp(self.Tcomb)
+
+        dh = {
+            "fl_in.W": -fuel_W * q / W_out**2,
+            "fl_in.Tt": self.gas.cp(self.fl_in.Tt),
+            "fuel_W": q * W / W_out**2,
+            "fhv": fuel_W / W_out * self.eff,
+            "eff": fuel_W / W_out * self.fhv,
+        }
+        partials = {name: {"Tcomb": d / cp_out, "fl_out.Tt": d / cp_out} for name, d in dh.items()}
+        partials["fl_in.W"]["fl_out.W"] = 1.0
+        partials["fuel_W"]["fl_out.W"] = 1.0
+        partials["fl_in.Pt"] = {"fl_out.Pt": 1.0}
+
+        return partials
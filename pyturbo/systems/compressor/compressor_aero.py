@@ -1,13 +1,14 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-from math import sqrt
+from typing import Dict
 
 import numpy as np
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort, ShaftPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
+from pyturbo.thermo.ideal_gas import ArrayLike
 
 
 class CompressorAero(System):
@@ -77,7 +78,7 @@ class CompressorAero(System):
 
     def setup(self, FluidLaw=IdealDryAir):
         # properties
-        self.add_inward("gas", FluidLaw())
+        self.add_inward("gas", shared_gas(FluidLaw))
 
         # inputs/outputs
         self.add_input(FluidPort, "fl_in")
@@ -174,7 +175,87 @@ class CompressorAero(System):
         self.psi = self.tip_out_r / self.tip_in_r * (1 - self.phi / self.phiP)
         self.eps_psi = delta_h / (self.stage_count * self.utip**2) - self.psi
 
-        Wc = self.fl_in.W * sqrt(self.fl_in.Tt / 288.15) / (self.fl_in.Pt / 101325.0)
+        Wc = self.fl_in.W * np.sqrt(self.fl_in.Tt / 288.15) / (self.fl_in.Pt / 101325.0)
 
         self.spec_flow = Wc / self.inlet_area
         self.pcnr = self.sh_in.N / self.xnd * 100.0
+
+    def partials(self) -> Dict[str, Dict[str, ArrayLike]]:
+        """Partial derivatives of outputs with respect to inputs, at the current point.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            derivatives `d[wrt][of]`, outputs not listed do not depend on `wrt`
+        """
+        gas = self.gas
+        W, Pt, Tt = self.fl_in.W, self.fl_in.Pt, self.fl_in.Tt
+        power, N = self.sh_in.power, self.sh_in.N
+        Tt_out, pr = self.fl_out.Tt, self.pr
+        r_in, r_out, area = self.tip_in_r, self.tip_out_r, self.inlet_area
+        n, phi, psi, phiP = self.stage_count, self.phi, self.psi, self.phiP
+        spec_flow = self.spec_flow
+
+        # exit temperature and pressure ratio
+        cp_out = gas.cp(Tt_out)
+        dTo = {
+            "fl_in.W": -power / (W**2 * cp_out),
+            "fl_in.Tt": gas.cp(Tt) / cp_out,
+            "sh_in.power": 1.0 / (W * cp_out),
+        }
+        dpr_dt1, dpr_dt2, dpr_deff = gas.pr_partials(Tt, Tt_out, self.eff_poly)
+        dpr = {name: dpr_dt2 * d for name, d in dTo.items()}
+        dpr["fl_in.Tt"] += dpr_dt1
+        dpr["eff_poly"] = dpr_deff
+
+        # axial flow and load coefficients
+        dutip_dN = np.pi / 30.0 * r_out
+        utip = N * dutip_dN
+        dphi = {
+            "fl_in.W": phi / W,
+            "fl_in.Pt": -phi / Pt,
+            "fl_in.Tt": phi / Tt,
+            "sh_in.N": -phi / N,
+            "tip_out_r": -phi / r_out,
+            "inlet_area": -phi / area,
+        }
+        k = r_out / r_in
+        dpsi = {name: -k / phiP * d for name, d in dphi.items()}
+        dpsi["tip_out_r"] += psi / r_out
+        dpsi["tip_in_r"] = -psi / r_in
+        dpsi["phiP"] = k * phi / phiP**2
+
+        e = power / (W * n * utip**2)
+        deps = {name: -d for name, d in dpsi.items()}
+        deps["sh_in.power"] = 1.0 / (W * n * utip**2)
+        deps["fl_in.W"] -= e / W
+        deps["sh_in.N"] -= 2.0 * e / N
+        deps["tip_out_r"] -= 2.0 * e / r_out
+        deps["stage_count"] = -e / n
+
+        partials = {name: {} for name in [*dpsi, "eff_poly", "xnd", "sh_in.power", "stage_count"]}
+        for name, d in dTo.items():
+            partials[name]["fl_out.Tt"] = d
+            partials[name]["tr"] = d / Tt
+        partials["fl_in.Tt"]["tr"] -= Tt_out / Tt**2
+        for name, d in dpr.items():
+            partials[name]["pr"] = d
+            partials[name]["fl_out.Pt"] = Pt * d
+        partials["fl_in.Pt"]["fl_out.Pt"] = pr
+        partials["fl_in.W"]["fl_out.W"] = 1.0
+        partials["sh_in.N"]["utip"] = dutip_dN
+        partials["tip_out_r"]["utip"] = N * np.pi / 30.0
+        for name, d in dphi.items():
+            partials[name]["phi"] = d
+        for name, d in dpsi.items():
+            partials[name]["psi"] = d
+        for name, d in deps.items():
+            partials[name]["eps_psi"] = d
+        partials["fl_in.W"]["spec_flow"] = spec_flow / W
+        partials["fl_in.Pt"]["spec_flow"] = -spec_flow / Pt
+        partials["fl_in.Tt"]["spec_flow"] = 0.5 * spec_flow / Tt
+        partials["inlet_area"]["spec_flow"] = -spec_flow / area
+        partials["sh_in.N"]["pcnr"] = 100.0 / self.xnd
+        partials["xnd"]["pcnr"] = -self.pcnr / self.xnd
+
+        return partials
@@ -3,5 +3,13 @@
 
 from pyturbo.systems.generic.generic_simple_view import GenericSimpleView
 from pyturbo.systems.generic.generic_system_view import GenericSystemView
+from pyturbo.systems.generic.view_system import ViewSystem, lazy_views, set_lazy_views, update_views
 
-__all__ = ["GenericSimpleView", "GenericSystemView"]
+__all__ = [
+    "GenericSimpleView",
+    "GenericSystemView",
+    "ViewSystem",
+    "lazy_views",
+    "set_lazy_views",
+    "update_views",
+]
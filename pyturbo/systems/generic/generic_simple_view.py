@@ -1,12 +1,11 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-from cosapp.systems import System
-
 from pyturbo.ports import KeypointsPort, View, ViewPort
+from pyturbo.systems.generic.view_system import ViewSystem
 
 
-class GenericSimpleView(System):
+class GenericSimpleView(ViewSystem):
     """Class with visual representation of a generic simple view.
 
     Inputs
@@ -30,7 +29,7 @@ class GenericSimpleView(System):
         # inwards
         self.add_inward("n", 1, unit="", desc="stage count")
 
-    def compute(self):
+    def compute_view(self):
         shell = {
             "shape": self.kp.view(self.shell_view),
             "face_color": "white",
@@ -1,12 +1,11 @@
 # Copyright (C) 2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-from cosapp.base import System
-
 from pyturbo.ports import View, ViewPort
+from pyturbo.systems.generic.view_system import ViewSystem
 
 
-class GenericSystemView(System):
+class GenericSystemView(ViewSystem):
     """Visual representation of a system.
 
     Parameter
@@ -22,7 +21,7 @@ class GenericSystemView(System):
     Outputs
     -------
     occ_view : ViewPort
-        system view
+        system view, with shapes named f"{child_name}.{shape_name}"
     """
 
     def setup(self, children_name=None):
@@ -34,11 +33,6 @@ class GenericSystemView(System):
 
         self.add_output(ViewPort, "occ_view")
 
-    def compute(self):
-
-        view = View()
-
-        for child_name in self.children_name:
-            view = view.merge(self[f"{child_name}_view"])
-
-        self.occ_view.set_value(view)
+    def compute_view(self):
+        views = {name: self[f"{name}_view"] for name in self.children_name}
+        self.occ_view.set_value(View.from_views(views))
@@ -0,0 +1,93 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from contextlib import contextmanager
+
+from cosapp.systems import System
+
+from pyturbo.ports import ViewPort
+from pyturbo.utils.view_tools import occ_available
+
+
+class ViewSystem(System):
+    """Base class of systems computing a visual representation.
+
+    The view is built by `compute_view`. When `lazy` is True, `compute` does nothing, so
+    solvers never build views; they are then built on demand by `update_views`. Views are not
+    built either when the geometry dependencies are not installed.
+
+    Attributes
+    ----------
+    lazy : bool, default=False
+        whether the view is only built on demand
+    """
+
+    lazy = False
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["lazy"] = self.lazy
+        return state
+
+    def __setstate__(self, state):
+        lazy = state.pop("lazy", False)
+        super().__setstate__(state)
+        self.lazy = lazy
+
+    def compute(self):
+        if not self.lazy and occ_available():
+            self.compute_view()
+
+    def compute_view(self):
+        """Build the view from the current inputs."""
+        pass
+
+
+def set_lazy_views(system: System, lazy: bool = True):
+    """Set the `lazy` mode of all views of `system` and its sub-systems."""
+    for child in system.tree():
+        if isinstance(child, ViewSystem):
+            child.lazy = lazy
+
+
+def update_views(system: System):
+    """Build all views of `system` and its sub-systems from their current inputs.
+
+    Views are built and transferred in execution order, other systems are not run.
+    """
+    for child in system.tree():
+        if isinstance(child, ViewSystem):
+            parent = child.parent
+            if child is not system and parent is not None:
+                for connector in parent.connectors().values():
+                    if connector.sink.owner is child and connector.is_active:
+                        connector.transfer()
+            child.compute_view()
+
+        elif child.children:
+            # views pulled from sub-systems
+            for connector in child.connectors().values():
+                sink = connector.sink
+                if sink.owner is child and isinstance(sink, ViewPort) and connector.is_active:
+                    connector.transfer()
+
+
+@contextmanager
+def lazy_views(system: System):
+    """Context in which the views of `system` are not built, then built on exit.
+
+    Examples
+    --------
+    >>> with lazy_views(sys):
+    ...     sys.run_drivers()
+    >>> sys.occ_view.render()
+    """
+    views = [child for child in system.tree() if isinstance(child, ViewSystem)]
+    modes = [view.lazy for view in views]
+    set_lazy_views(system, True)
+    try:
+        yield system
+    finally:
+        for view, lazy in zip(views, modes):
+            view.lazy = lazy
+    update_views(system)
@@ -4,7 +4,7 @@
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
 
 
 class InletAero(System):
@@ -56,7 +56,7 @@ class InletAero(System):
         self.add_output(FluidPort, "fl_out")
 
         # inwards/outwards
-        self.add_inward("gas", FluidFlow())
+        self.add_inward("gas", shared_gas(FluidFlow))
         self.add_inward("pamb", 101325.0, unit="Pa", desc="ambient static pressure")
 
         self.add_inward("area", 1.0, unit="m**2", desc="throat area")
@@ -1,10 +1,13 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Dict
+
 import numpy as np
 from cosapp.systems import System
 
 from pyturbo.ports.fluid_port import FluidPort
+from pyturbo.thermo.ideal_gas import ArrayLike
 
 
 class MixerFluid(System):
@@ -98,9 +101,9 @@ class MixerFluid(System):
         # input flows
         fluid_in_ports = [p for p in self.inputs.values() if isinstance(p, FluidPort)]
 
-        self.W = np.sum([p.W for p in fluid_in_ports])
-        self.Pt = np.mean([p.Pt for p in fluid_in_ports])
-        self.Tt = np.mean([p.W * p.Tt for p in fluid_in_ports]) / self.W
+        self.W = sum(p.W for p in fluid_in_ports)
+        self.Pt = sum(p.Pt for p in fluid_in_ports) / len(fluid_in_ports)
+        self.Tt = sum(p.W * p.Tt for p in fluid_in_ports) / len(fluid_in_ports) / self.W
 
         # output flows
         fluid_out_ports = [p for p in self.outputs.values() if isinstance(p, FluidPort)]
@@ -114,3 +117,40 @@ class MixerFluid(System):
                 W += p.W
             else:
                 p.W = self.W - W
+
+    def partials(self) -> Dict[str, Dict[str, ArrayLike]]:
+        """Partial derivatives of outputs with respect to inputs, at the current point.
+
+        Returns
+        -------
+        dict[str, dict[str, float or np.ndarray]]
+            derivatives `d[wrt][of]`, outputs not listed do not depend on `wrt`; derivatives
+            with respect to `fluid_fractions` are arrays
+        """
+        fluid_in_ports = [p for p in self.inputs.values() if isinstance(p, FluidPort)]
+        fluid_out_ports = [p for p in self.outputs.values() if isinstance(p, FluidPort)]
+        n_in = len(fluid_in_ports)
+
+        fractions = list(self.fluid_fractions) if self.n_out > 1 else []
+        fractions.append(1.0 - sum(fractions))
+
+        partials = {}
+        for p in fluid_in_ports:
+            dW = {"W": 1.0, "Tt": p.Tt / (n_in * self.W) - self.Tt / self.W}
+            dPt = {"Pt": 1.0 / n_in}
+            dTt = {"Tt": p.W / (n_in * self.W)}
+            for q, fraction in zip(fluid_out_ports, fractions):
+                dW[f"{q.name}.W"] = fraction
+                dW[f"{q.name}.Tt"] = dW["Tt"]
+                dPt[f"{q.name}.Pt"] = dPt["Pt"]
+                dTt[f"{q.name}.Tt"] = dTt["Tt"]
+            partials.update({f"{p.name}.W": dW, f"{p.name}.Pt": dPt, f"{p.name}.Tt": dTt})
+
+        if self.n_out > 1:
+            size = self.n_out - 1
+            partials["fluid_fractions"] = {
+                f"{q.name}.W": self.W * (np.eye(size)[i] if i < size else -np.ones(size))
+                for i, q in enumerate(fluid_out_ports)
+            }
+
+        return partials
@@ -1,10 +1,13 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Dict
+
 import numpy as np
 from cosapp.systems import System
 
 from pyturbo.ports import ShaftPort
+from pyturbo.thermo.ideal_gas import ArrayLike
 
 
 class MixerShaft(System):
@@ -94,8 +97,8 @@ class MixerShaft(System):
         # input shafts
         shaft_in_ports = [p for p in self.inputs.values() if isinstance(p, ShaftPort)]
 
-        self.power = np.sum([p.power for p in shaft_in_ports])
-        self.N = np.mean([p.N for p in shaft_in_ports])
+        self.power = sum(p.power for p in shaft_in_ports)
+        self.N = sum(p.N for p in shaft_in_ports) / len(shaft_in_ports)
 
         # output shafts
         shaft_out_ports = [p for p in self.outputs.values() if isinstance(p, ShaftPort)]
@@ -108,3 +111,37 @@ class MixerShaft(System):
                 power += p.power
             else:
                 p.power = self.power - power
+
+    def partials(self) -> Dict[str, Dict[str, ArrayLike]]:
+        """Partial derivatives of outputs with respect to inputs, at the current point.
+
+        Returns
+        -------
+        dict[str, dict[str, float or np.ndarray]]
+            derivatives `d[wrt][of]`, outputs not listed do not depend on `wrt`; derivatives
+            with respect to `power_fractions` are arrays
+        """
+        shaft_in_ports = [p for p in self.inputs.values() if isinstance(p, ShaftPort)]
+        shaft_out_ports = [p for p in self.outputs.values() if isinstance(p, ShaftPort)]
+        n_in = len(shaft_in_ports)
+
+        fractions = list(self.power_fractions) if self.n_out > 1 else []
+        fractions.append(1.0 - sum(fractions))
+
+        partials = {}
+        for p in shaft_in_ports:
+            dpower = {"power": 1.0}
+            dN = {"N": 1.0 / n_in}
+            for q, fraction in zip(shaft_out_ports, fractions):
+                dpower[f"{q.name}.power"] = fraction
+                dN[f"{q.name}.N"] = dN["N"]
+            partials.update({f"{p.name}.power": dpower, f"{p.name}.N": dN})
+
+        if self.n_out > 1:
+            size = self.n_out - 1
+            partials["power_fractions"] = {
+                f"{q.name}.power": self.power * (np.eye(size)[i] if i < size else -np.ones(size))
+                for i, q in enumerate(shaft_out_ports)
+            }
+
+        return partials
@@ -2,16 +2,14 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import numpy as np
-from cosapp.systems import System
-from OCC.Core.Geom import Geom_RectangularTrimmedSurface
-from pyoccad.create import CreateAxis, CreateBezier, CreateRevolution, CreateWire
-from pyoccad.transform import Scale
 
 from pyturbo.ports import KeypointsPort
 from pyturbo.ports.view_port import View, ViewPort
+from pyturbo.systems.generic import ViewSystem
+from pyturbo.utils.shape_cache import cached_shape
 
 
-class NacelleView(System):
+class NacelleView(ViewSystem):
     """Class with visual representation of the Nacelle.
 
     Inputs
@@ -30,7 +28,7 @@ class NacelleView(System):
         self.add_input(KeypointsPort, "kp")
         self.add_output(ViewPort, "occ_view")
 
-    def compute(self):
+    def compute_view(self):
         r = self.kp.exit_tip[0] * 1.2
         z = 0.6 * self.kp.inlet_hub[1] + 0.4 * self.kp.exit_hub[1]
 
@@ -51,6 +49,7 @@ class NacelleView(System):
         self.occ_view.set_value(view)
 
 
+@cached_shape
 def bezier(hilite_kp, external_max_diameter, secondary_nozzle_exit_tip, fan_diameter, vect):
     """Generate a Bezier surface for a nozzle using key points and specified axis direction.
 
@@ -72,6 +71,9 @@ def bezier(hilite_kp, external_max_diameter, secondary_nozzle_exit_tip, fan_diam
     r : pyoccad.Shape
         The pyoccad shape representing the Bezier surface of the nozzle after revolution.
     """
+    from OCC.Core.Geom import Geom_RectangularTrimmedSurface
+    from pyoccad.create import CreateAxis, CreateBezier, CreateRevolution, CreateWire
+    from pyoccad.transform import Scale
 
     axis = [rx_to_3d, ry_to_3d, rz_to_3d]
     for i, x in enumerate(vect):
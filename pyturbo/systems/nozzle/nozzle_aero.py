@@ -5,7 +5,7 @@ import numpy as np
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
 
 
 class NozzleAero(System):
@@ -59,7 +59,7 @@ class NozzleAero(System):
 
     def setup(self, FluidLaw=IdealDryAir):
         # properties
-        self.add_inward("gas", FluidLaw())
+        self.add_inward("gas", shared_gas(FluidLaw))
 
         # inputs / outputs
         self.add_input(FluidPort, "fl_in")
@@ -97,7 +97,7 @@ class NozzleAero(System):
             self.fl_out.Pt, self.fl_out.Tt, 1, tol=1e-6
         )  # Static critical pressure is static presure when Mach = 1.0
 
-        ps_exit = max(ps_crit, self.pamb)
+        ps_exit = np.maximum(ps_crit, self.pamb)
 
         self.mach = self.gas.mach_f_ptpstt(self.fl_in.Pt, ps_exit, self.fl_in.Tt, tol=1e-6)
 
@@ -4,7 +4,7 @@
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
 
 
 class ChannelAero(System):
@@ -39,7 +39,7 @@ class ChannelAero(System):
 
     def setup(self, FluidLaw=IdealDryAir):
         # properties
-        self.add_inward("gas", FluidLaw())
+        self.add_inward("gas", shared_gas(FluidLaw))
 
         # aero
         self.add_input(FluidPort, "fl_in")
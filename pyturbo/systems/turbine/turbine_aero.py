@@ -1,11 +1,14 @@
 # Copyright (C) 2022-2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Dict
+
 import numpy as np
 from cosapp.systems import System
 
 from pyturbo.ports import FluidPort, ShaftPort
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas
+from pyturbo.thermo.ideal_gas import ArrayLike
 
 
 class TurbineAero(System):
@@ -62,7 +65,7 @@ class TurbineAero(System):
 
     def setup(self, FluidLaw=IdealDryAir):
         # properties
-        self.add_inward("gas", FluidLaw())
+        self.add_inward("gas", shared_gas(FluidLaw))
 
         # inputs/outputs
         self.add_input(FluidPort, "fl_in")
@@ -115,3 +118,67 @@ class TurbineAero(System):
             self.gas.wqa_crit(self.fl_in.Pt, self.fl_in.Tt, tol=1e-6) * self.area_in / self.blokage
         )
         self.Tt_ratio = self.fl_out.Tt / self.fl_in.Tt
+
+    def partials(self) -> Dict[str, Dict[str, ArrayLike]]:
+        """Partial derivatives of outputs with respect to inputs, at the current point.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            derivatives `d[wrt][of]`, outputs not listed do not depend on `wrt`
+        """
+        gas = self.gas
+        W, Pt, Tt = self.fl_in.W, self.fl_in.Pt, self.fl_in.Tt
+        Tt_out, dhqt, eff = self.fl_out.Tt, self.dhqt, self.eff_poly
+        psi, Wc, Wcrit = self.psi, self.Wc, self.Wcrit
+        sh_N = self.sh_out.N
+
+        # exit temperature and pressure
+        cp_out = gas.cp(Tt_out)
+        dTo = {"fl_in.Tt": (gas.cp(Tt) - dhqt) / cp_out, "dhqt": -Tt / cp_out}
+        pr = gas.pr(Tt, Tt_out, 1.0 / eff)
+        dpr_dt1, dpr_dt2, dpr_deff = gas.pr_partials(Tt, Tt_out, 1.0 / eff)
+        dpr = {name: dpr_dt2 * d for name, d in dTo.items()}
+        dpr["fl_in.Tt"] += dpr_dt1
+        dpr["eff_poly"] = -dpr_deff / eff**2
+
+        dwqa_dpt, dwqa_dtt = gas.wqa_crit_partials(Pt, Tt, tol=1e-6)
+        k = self.area_in / self.blokage
+
+        partials = {
+            "fl_in.W": {
+                "fl_out.W": 1.0,
+                "sh_out.power": dhqt * Tt,
+                "Wc": Wc / W,
+            },
+            "fl_in.Pt": {
+                "fl_out.Pt": pr,
+                "Wc": -Wc / Pt,
+                "Wcrit": dwqa_dpt * k,
+            },
+            "fl_in.Tt": {
+                "sh_out.N": 0.5 * sh_N / Tt,
+                "sh_out.power": W * dhqt,
+                "Wc": 0.5 * Wc / Tt,
+                "Wcrit": dwqa_dtt * k,
+            },
+            "dhqt": {
+                "sh_out.power": W * Tt,
+                "psi": psi / dhqt,
+            },
+            "eff_poly": {},
+            "Ncdes": {"sh_out.N": sh_N / self.Ncdes, "psi": -2.0 * psi / self.Ncdes},
+            "Ncqdes": {"sh_out.N": sh_N / self.Ncqdes, "psi": -2.0 * psi / self.Ncqdes},
+            "area_in": {"Wcrit": Wcrit / self.area_in},
+            "blokage": {"Wcrit": -Wcrit / self.blokage},
+            "mean_radius": {"psi": -2.0 * psi / self.mean_radius},
+            "stage_count": {"psi": -psi / self.stage_count},
+        }
+        for name, d in dTo.items():
+            partials[name]["fl_out.Tt"] = d
+            partials[name]["Tt_ratio"] = d / Tt
+        partials["fl_in.Tt"]["Tt_ratio"] -= Tt_out / Tt**2
+        for name, d in dpr.items():
+            partials[name]["fl_out.Pt"] = Pt * d
+
+        return partials
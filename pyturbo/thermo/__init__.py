@@ -3,6 +3,18 @@
 
 from pyturbo.thermo.ideal_gas import IdealGas  # isort: skip
 from pyturbo.thermo.ideal_dry_air import IdealDryAir
-from pyturbo.thermo.init_environment import init_environment
 
-__all__ = ["IdealGas", "IdealDryAir", "init_environment"]
+from pyturbo.thermo.gas_registry import clear_gas_registry, shared_gas  # isort: skip
+from pyturbo.thermo.standard_atmosphere import StandardAtmosphere, standard_atmosphere
+
+from pyturbo.thermo.init_environment import init_environment  # isort: skip
+
+__all__ = [
+    "IdealGas",
+    "IdealDryAir",
+    "shared_gas",
+    "clear_gas_registry",
+    "StandardAtmosphere",
+    "standard_atmosphere",
+    "init_environment",
+]
@@ -0,0 +1,55 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from functools import wraps
+from numbers import Number
+from typing import Callable, Hashable, Optional
+
+from pyturbo.utils.lru_cache import CacheInfo, LRUCache  # noqa: F401
+
+
+class GasCache(LRUCache):
+    """Bounded LRU cache of gas property calls.
+
+    Keys are built from the method name and the exact values of its arguments, so only calls
+    with scalar arguments are cached.
+
+    Parameters
+    ----------
+    maxsize: int, default=4096
+        maximum number of cached calls, the least recently used ones are evicted first
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__(maxsize)
+
+    @staticmethod
+    def key(name: str, args: tuple, kwargs: dict) -> Optional[Hashable]:
+        """Return the cache key of a call, or None if it cannot be cached."""
+        values = args + tuple(kwargs.values())
+        if not all(isinstance(v, Number) for v in values):
+            return None
+        return (name, args, tuple(kwargs.items()))
+
+
+def memoized(method: Callable) -> Callable:
+    """Decorate a pure gas method to use the gas cache, if enabled."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = cache.key(name, args, kwargs)
+        if key is None:
+            return method(self, *args, **kwargs)
+
+        value = cache.get(key)
+        if value is GasCache._MISSING:
+            value = method(self, *args, **kwargs)
+            cache.set(key, value)
+        return value
+
+    return wrapper
@@ -0,0 +1,61 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from typing import Dict, Hashable, Type
+
+from pyturbo.thermo import IdealDryAir, IdealGas
+
+_registry: Dict[Hashable, IdealGas] = {}
+
+
+def shared_gas(law: Type[IdealGas] = IdealDryAir, *args) -> IdealGas:
+    """Return the shared instance of a gas law.
+
+    All the callers asking for the same law (class and constructor arguments) get the same
+    frozen instance, so that its tables and memoization cache are shared as well. Shared
+    instances are unpickled as the shared instance of the process; if it does not exist yet,
+    it is created with the same tables and cache size.
+
+    Parameters
+    ----------
+    law: Class, default=IdealDryAir
+        gas law class
+    *args:
+        gas law constructor arguments, must be hashable
+
+    Returns
+    -------
+    gas: IdealGas
+        the frozen shared instance
+    """
+    key = (law, args)
+    try:
+        return _registry[key]
+    except KeyError:
+        gas = law(*args)
+        gas._shared = key
+        _registry[key] = gas.freeze()
+        return gas
+
+
+def _load_shared_gas(law, args, table_args, tabulated, maxsize) -> IdealGas:
+    """Return the shared instance of a pickled shared gas.
+
+    An existing shared instance is returned untouched, as other systems may use it; a new one
+    is set up as the pickled one.
+    """
+    if (law, args) in _registry:
+        return _registry[(law, args)]
+
+    gas = shared_gas(law, *args)
+    if table_args is not None:
+        gas.tabulate(*table_args)
+        gas.tabulated = tabulated
+    if maxsize is not None:
+        gas.enable_cache(maxsize)
+    return gas
+
+
+def clear_gas_registry():
+    """Forget all shared gas instances."""
+    _registry.clear()
@@ -1,22 +1,412 @@
 # Copyright (C) 2022-2023, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+from functools import cached_property
+from typing import Callable, Dict, Optional, Tuple, Union
+
 import numpy as np
 import pythermo
-from scipy.optimize import root, toms748
+from scipy.interpolate import CubicSpline
+
+from pyturbo.thermo.gas_cache import CacheInfo, GasCache, memoized
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def _as_output(x: np.ndarray) -> ArrayLike:
+    """Return a python float for 0-d arrays, the array itself otherwise."""
+    return x.item() if x.ndim == 0 else x
+
+
+def _solve_bracket(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: np.ndarray,
+    b: np.ndarray,
+    xtol: float = 2e-12,
+    rtol: float = 4.0 * np.finfo(float).eps,
+    maxiter: int = 100,
+):
+    """Element-wise root of `f` in [a, b] using the Illinois (modified regula falsi) method.
+
+    All elements are solved at once; `f` must support broadcasting.
+
+    Returns
+    -------
+    x: np.ndarray
+        root estimates
+    valid: np.ndarray of bool
+        False where `f(a)` and `f(b)` have the same sign (no root bracketed)
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a, b = a.copy(), b.copy()
+    fa, fb = f(a), f(b)
+    a, b, fa, fb = np.broadcast_arrays(a, b, fa, fb)
+    a, b, fa, fb = a.copy(), b.copy(), fa.copy(), fb.copy()
+
+    valid = np.sign(fa) * np.sign(fb) <= 0.0
+    side = np.zeros(a.shape, dtype=int)
+    x = np.where(np.abs(fa) < np.abs(fb), a, b)
+    active = valid & (fa != 0.0) & (fb != 0.0)
+    x = np.where(fa == 0.0, a, x)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxiter):
+            if not np.any(active):
+                break
+
+            c = np.where(active, (a * fb - b * fa) / (fb - fa), x)
+            c = np.where(np.isfinite(c), c, 0.5 * (a + b))
+            fc = f(c)
+
+            same_b = active & (np.sign(fc) == np.sign(fb))
+            same_a = active & ~same_b & (np.sign(fc) == np.sign(fa))
+
+            fa = np.where(same_b & (side == -1), 0.5 * fa, fa)
+            b = np.where(same_b, c, b)
+            fb = np.where(same_b, fc, fb)
+
+            fb = np.where(same_a & (side == 1), 0.5 * fb, fb)
+            a = np.where(same_a, c, a)
+            fa = np.where(same_a, fc, fa)
+
+            side = np.where(same_b, -1, np.where(same_a, 1, side))
+
+            converged = np.abs(c - x) <= xtol + rtol * np.abs(c)
+            x = np.where(active, c, x)
+            active &= ~converged & (fc != 0.0)
+
+    return x, valid
 
 
 class IdealGas(pythermo.IdealGas):
-    """Ideal gas model customized from `pythermo`."""
+    """Ideal gas model customized from `pythermo`.
+
+    All the methods accept scalars or `numpy` arrays of any shape. Array arguments are
+    broadcast together, and iterative inversions are solved for all elements at once.
+    A python float is returned when all arguments are scalars.
+
+    An optional bounded LRU cache memoizes the pure property functions called with scalar
+    arguments, see `enable_cache`.
+
+    A frozen gas only accepts changes of its tables and cache, see `freeze`. The instances
+    shared by `shared_gas` are pickled by reference to the registry, with their tabulation
+    parameters and cache size: on loading, these are applied to the shared instance of the
+    process only if it is created then. Cached values are not pickled.
+    """
+
+    # Mach-vs-specific-flow table used by `mach_f_wqa`
+    _WQA_TABLE_SIZE = 65
+    _WQA_TABLE_MACH_MAX = 5.0
+    _WQA_TABLE_S_MIN = 0.05
+    _WQA_NEWTON_MAXITER = 4
+
+    # Safeguarded Newton iterations used by `mach_f_ptpstt`
+    _PTPS_MACH_MAX = 10.0
+    _PTPS_MAXITER = 20
+
+    # Enthalpy and entropy function tables, see `tabulate`
+    _tables: Optional[Dict[str, CubicSpline]] = None
+    _table_args: Optional[tuple] = None
+    _tabulated: bool = False
+
+    # Memoization of property calls, see `enable_cache`
+    _cache: Optional[GasCache] = None
+
+    # Attributes which may still be set once frozen, see `freeze`
+    _frozen: bool = False
+    _MUTABLE_WHEN_FROZEN = (
+        "_tables",
+        "_table_args",
+        "table_error",
+        "tabulated",
+        "_tabulated",
+        "_cache",
+    )
+
+    # Registry key of a shared instance, see `shared_gas`
+    _shared: Optional[tuple] = None
+
+    def freeze(self) -> "IdealGas":
+        """Make the gas law immutable, so that it can be safely shared by many systems.
+
+        Only the acceleration structures (tables and cache) may still change.
+
+        Returns
+        -------
+        self: IdealGas
+            the frozen gas
+        """
+        self._frozen = True
+        return self
+
+    def __reduce_ex__(self, protocol):
+        if self._shared is None:
+            return super().__reduce_ex__(protocol)
 
-    def static_p(self, pt: float, tt: float, mach: float, tol: float) -> float:
+        from pyturbo.thermo.gas_registry import _load_shared_gas
+
+        law, args = self._shared
+        maxsize = None if self._cache is None else self._cache.maxsize
+        return _load_shared_gas, (law, args, self._table_args, self.tabulated, maxsize)
+
+    def __setattr__(self, name: str, value):
+        if self._frozen and name not in self._MUTABLE_WHEN_FROZEN:
+            raise AttributeError(f"Cannot set attribute {name!r} of a frozen gas.")
+        super().__setattr__(name, value)
+
+    def enable_cache(self, maxsize: int = 4096) -> "IdealGas":
+        """Memoize property calls with scalar arguments in a bounded LRU cache.
+
+        Calls are keyed on the exact values of their arguments.
+
+        maxsize[-]: int, default=4096
+            maximum number of cached calls
+
+        Returns
+        -------
+        self: IdealGas
+            the gas, with cache enabled
+        """
+        self._cache = GasCache(maxsize)
+        return self
+
+    def disable_cache(self):
+        """Disable and drop the memoization cache."""
+        self._cache = None
+
+    def cache_clear(self):
+        """Clear the memoization cache, if enabled, and reset its statistics."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Return the hit/miss statistics of the memoization cache, None if disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    @property
+    def tabulated(self) -> bool:
+        """Whether the tabulated mode is on, see `tabulate`."""
+        return self._tabulated
+
+    @tabulated.setter
+    def tabulated(self, value: bool):
+        self._tabulated = value
+        self.cache_clear()
+
+    def tabulate(self, t_min: float = 150.0, t_max: float = 2500.0, size: int = 512) -> "IdealGas":
+        """Build enthalpy and entropy function tables and switch to the tabulated mode.
+
+        `h`, `phi` and their inverses `t_f_h` and `t_f_phi` are then interpolated by cubic
+        splines built once over [t_min, t_max], instead of being computed or inverted
+        iteratively. Calls with values out of the table range use the exact path.
+
+        Temperatures are sampled uniformly in `log(t)`. Enthalpy tables are interpolated in `t`
+        and entropy function tables in `log(t)`, so that all tables are exact (up to round-off)
+        for a constant `cp`. Otherwise, the interpolation error scales as
+        `(log(t_max / t_min) / size)**4` times the fourth derivative of the tabulated laws.
+        It is measured against the exact path at mid-points when the tables are built, and
+        stored in `table_error` (absolute errors on `h`, `phi` and temperature).
+
+        Set `tabulated` to False to fall back to the exact path.
+
+        t_min[K]: float, default=150.0
+            lower bound of the tables
+        t_max[K]: float, default=2500.0
+            upper bound of the tables
+        size[-]: int, default=512
+            number of temperature samples
+
+        Returns
+        -------
+        self: IdealGas
+            the gas, in tabulated mode
+        """
+        h_exact, phi_exact = super().h, super().phi
+
+        # grid uniform in log(t), phi tables are interpolated in log(t)
+        t = np.geomspace(t_min, t_max, size)
+        h = np.array([h_exact(ti) for ti in t])
+        phi = np.array([phi_exact(ti) for ti in t])
+
+        self._table_args = (t_min, t_max, size)
+        self._tables = tables = {
+            "h": CubicSpline(t, h),
+            "phi": CubicSpline(np.log(t), phi),
+            "t_f_h": CubicSpline(h, t),
+            "t_f_phi": CubicSpline(phi, np.log(t)),
+        }
+
+        t_mid = np.sqrt(t[1:] * t[:-1])
+        h_mid = np.array([h_exact(ti) for ti in t_mid])
+        phi_mid = np.array([phi_exact(ti) for ti in t_mid])
+        self.table_error = {
+            "h": np.max(np.abs(tables["h"](t_mid) - h_mid)),
+            "phi": np.max(np.abs(tables["phi"](np.log(t_mid)) - phi_mid)),
+            "t": max(
+                np.max(np.abs(tables["t_f_h"](h_mid) - t_mid)),
+                np.max(np.abs(np.exp(tables["t_f_phi"](phi_mid)) - t_mid)),
+            ),
+        }
+
+        self.tabulated = True
+        return self
+
+    def _table(self, name: str, x: ArrayLike) -> Optional[CubicSpline]:
+        """Return the table `name` if the tabulated mode is on and `x` is within its range."""
+        if not self.tabulated or self._tables is None:
+            return None
+
+        table = self._tables[name]
+        if np.all((x >= table.x[0]) & (x <= table.x[-1])):
+            return table
+
+        return None
+
+    @memoized
+    def h(self, t: ArrayLike) -> ArrayLike:
+        """Enthalpy.
+
+        t[K]: float or np.ndarray
+            temperature
+        """
+        table = self._table("h", t)
+        if table is None:
+            return super().h(t)
+        return _as_output(table(t))
+
+    @memoized
+    def phi(self, t: ArrayLike) -> ArrayLike:
+        """Entropy function.
+
+        t[K]: float or np.ndarray
+            temperature
+        """
+        table = self._table("phi", np.log(t))
+        if table is None:
+            return super().phi(t)
+        return _as_output(table(np.log(t)))
+
+    @memoized
+    def t_f_h(self, h: ArrayLike, tol: float = 1e-6) -> ArrayLike:
+        """Temperature from enthalpy.
+
+        The exact path of arrays uses Newton iterations with `d(h)/dt = cp`, all elements at once.
+
+        h[J/kg]: float or np.ndarray
+            enthalpy
+        tol[]: float
+            numerical precision of the exact path
+        """
+        table = self._table("t_f_h", h)
+        if table is not None:
+            return _as_output(table(h))
+        if np.ndim(h) == 0:
+            return super().t_f_h(h, tol=tol)
+
+        h = np.asarray(h, dtype=float)
+        t = np.full_like(h, 288.15)
+        for _ in range(50):
+            dt = (h - super().h(t)) / self.cp(t)
+            t = np.maximum(t + dt, 0.5 * t)
+            if np.all(np.abs(dt) <= tol * t):
+                break
+
+        return t
+
+    @memoized
+    def t_f_phi(self, phi: ArrayLike, tol: float = 1e-6) -> ArrayLike:
+        """Temperature from entropy function.
+
+        The exact path uses Newton iterations with `d(phi)/dt = cp / t`.
+
+        phi[J/kg/K]: float or np.ndarray
+            entropy function
+        tol[]: float
+            numerical precision of the exact path
+        """
+        table = self._table("t_f_phi", phi)
+        if table is not None:
+            return _as_output(np.exp(table(phi)))
+
+        phi = np.asarray(phi, dtype=float)
+        t = np.full_like(phi, 288.15)
+        for _ in range(50):
+            dt = (phi - super().phi(t)) * t / self.cp(t)
+            t = np.maximum(t + dt, 0.5 * t)
+            if np.all(np.abs(dt) <= tol * t):
+                break
+
+        return _as_output(t)
+
+    @memoized
+    def pr(self, t1: ArrayLike, t2: ArrayLike, eff_poly: ArrayLike) -> ArrayLike:
+        """Pressure ratio.
+
+        t1[K]: float or np.ndarray
+            initial temperature
+        t2[K]: float or np.ndarray
+            final temperature
+        eff_poly[-]: float or np.ndarray
+            polytropic efficiency
+        """
+        return super().pr(t1, t2, eff_poly)
+
+    def pr_partials(
+        self, t1: ArrayLike, t2: ArrayLike, eff_poly: ArrayLike
+    ) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
+        """Partial derivatives of the pressure ratio.
+
+        Uses `log(pr) = eff_poly * (phi(t2) - phi(t1)) / r` and `d(phi)/dt = cp / t`.
+
+        Returns
+        -------
+        d(pr)/d(t1), d(pr)/d(t2), d(pr)/d(eff_poly)
+        """
+        pr = self.pr(t1, t2, eff_poly)
+        k = pr * eff_poly / self.r
+        return (
+            -k * self.cp(t1) / t1,
+            k * self.cp(t2) / t2,
+            pr * (self.phi(t2) - self.phi(t1)) / self.r,
+        )
+
+    @memoized
+    def static_t(self, tt: ArrayLike, mach: ArrayLike, tol: float = 1e-6) -> ArrayLike:
+        """Compute static temperature.
+
+        Inverse of `total_t`, solved by fixed point iterations.
+
+        tt[K]: float or np.ndarray
+            total temperature
+        mach[]: float or np.ndarray
+            Mach number
+        tol[]: float
+            numerical precision
+        """
+        tt, mach = np.broadcast_arrays(np.asarray(tt, dtype=float), np.asarray(mach, dtype=float))
+        k = 0.5 * mach**2
+
+        ts = tt / (1.0 + k * (self.gamma(tt) - 1.0))
+        for _ in range(50):
+            ts_new = tt / (1.0 + k * (self.gamma(ts) - 1.0))
+            converged = np.all(np.abs(ts_new - ts) <= tol * ts_new)
+            ts = ts_new
+            if converged:
+                break
+
+        return _as_output(np.asarray(ts))
+
+    @memoized
+    def static_p(self, pt: ArrayLike, tt: ArrayLike, mach: ArrayLike, tol: float) -> ArrayLike:
         """Compute static pressure.
 
-        pt[Pa]: float
+        pt[Pa]: float or np.ndarray
             total pressure
-        tt[K]: float
+        tt[K]: float or np.ndarray
             total temperature
-        mach[]: float
+        mach[]: float or np.ndarray
             Mach number
         tol[]: float
             numerical precision for iterative implementations
@@ -25,30 +415,31 @@ class IdealGas(pythermo.IdealGas):
         ps = pt * self.pr(tt, ts, 1.0)
         return ps
 
-    def c(self, ts: float) -> float:
+    def c(self, ts: ArrayLike) -> ArrayLike:
         """Speed of sound.
 
-        ts[K]: float
+        ts[K]: float or np.ndarray
             static temperature
         """
         return np.sqrt(self.gamma(ts) * self.r * ts)
 
-    def density(self, ps: float, ts: float) -> float:
+    def density(self, ps: ArrayLike, ts: ArrayLike) -> ArrayLike:
         """Density.
 
-        ps[Pa]: float
+        ps[Pa]: float or np.ndarray
             static pressure
-        ts[K]: float
+        ts[K]: float or np.ndarray
             static temperature
         """
         return ps / (self.r * ts)
 
-    def wqa_crit(self, pt: float, tt: float, tol: float) -> float:
+    @memoized
+    def wqa_crit(self, pt: ArrayLike, tt: ArrayLike, tol: float) -> ArrayLike:
         """Critical specific mass flow.
 
-        pt[Pa]: float
+        pt[Pa]: float or np.ndarray
             total pressure
-        tt[K]: float
+        tt[K]: float or np.ndarray
             total temperature
         tol[]: float
             numerical precision
@@ -61,79 +452,225 @@ class IdealGas(pythermo.IdealGas):
 
         return rho * c
 
-    def total_t(self, ts: float, mach: float) -> float:
+    def wqa_crit_partials(
+        self, pt: ArrayLike, tt: ArrayLike, tol: float
+    ) -> Tuple[ArrayLike, ArrayLike]:
+        """Partial derivatives of the critical specific mass flow.
+
+        It is proportional to `pt`; its derivative with respect to `tt` is computed by central
+        differences, with a tight tolerance on the static temperature.
+
+        Returns
+        -------
+        d(wqa_crit)/d(pt), d(wqa_crit)/d(tt)
+        """
+        dt = 1e-4 * np.asarray(tt)
+        tol = min(tol, 1e-12)
+        dwqa_dtt = (self.wqa_crit(pt, tt + dt, tol) - self.wqa_crit(pt, tt - dt, tol)) / (2 * dt)
+        return self.wqa_crit(pt, tt, tol) / pt, _as_output(np.asarray(dwqa_dtt))
+
+    def total_t(self, ts: ArrayLike, mach: ArrayLike) -> ArrayLike:
         """Total temperature.
 
-        ts[K]: float
+        ts[K]: float or np.ndarray
             static temperature
-        mach[]: float
+        mach[]: float or np.ndarray
             Mach number
         """
         return ts * (1.0 + 0.5 * (self.gamma(ts) - 1.0) * mach**2)
 
-    def total_p(self, ps: float, ts: float, tt: float) -> float:
+    def total_p(self, ps: ArrayLike, ts: ArrayLike, tt: ArrayLike) -> ArrayLike:
         """Total pressure.
 
-        ps[Pa]: float
+        ps[Pa]: float or np.ndarray
             static pressure
-        tt[K]: float
+        tt[K]: float or np.ndarray
             total temperature
-        ts[K]: float
+        ts[K]: float or np.ndarray
             static temperature
         """
         return ps * self.pr(ts, tt, 1.0)
 
+    @cached_property
+    def _mach_f_wqa_table(self) -> Tuple[CubicSpline, CubicSpline]:
+        """Splines of the Mach number as a function of `s = sqrt(1 - wqa / wqa_crit)`.
+
+        The change of variable removes the square-root singularity at Mach 1, so both the
+        subsonic (`s` from 1 to 0) and supersonic (`s` from 0) branches are smooth in `s`.
+        The table is built once per gas instance at sea level static conditions, it is exact
+        for a constant `gamma`, and a good initial guess otherwise.
+        """
+        pt, tt = 101325.0, 288.15
+        wqa_crit = self.wqa_crit(pt, tt, 1e-12)
+
+        def s_f_mach(mach):
+            ts = self.static_t(tt, mach, 1e-12)
+            ps = pt * self.pr(tt, ts, 1.0)
+            wqa = self.density(ps, ts) * mach * self.c(ts)
+            return np.sqrt(np.maximum(1.0 - wqa / wqa_crit, 0.0))
+
+        n = self._WQA_TABLE_SIZE
+        sub = np.linspace(1.0, 0.0, n)
+        sup = np.linspace(1.0, self._WQA_TABLE_MACH_MAX, n)
+
+        return CubicSpline(s_f_mach(sub), sub), CubicSpline(s_f_mach(sup), sup)
+
+    @memoized
     def mach_f_wqa(
-        self, pt: float, tt: float, wqa: float, tol: float, subsonic: bool = True
-    ) -> float:
+        self,
+        pt: ArrayLike,
+        tt: ArrayLike,
+        wqa: ArrayLike,
+        tol: float,
+        subsonic: bool = True,
+    ) -> ArrayLike:
         """Mach number.
 
-        pt[Pa]: float
+        The Mach number is interpolated in a precomputed table and refined by a Newton step,
+        then secant steps until the correction is within `tol`: one step is enough for a
+        constant `gamma`, a few more are needed otherwise, as the table is built at sea level
+        static conditions. Elements out of the table, near sonic conditions, or not converged
+        after `_WQA_NEWTON_MAXITER` steps, are solved by a bracketed search.
+        Elements for which the specific mass flow exceeds the critical one get a unit Mach number.
+
+        pt[Pa]: float or np.ndarray
             total pressure
-        tt[K]: float
+        tt[K]: float or np.ndarray
             total temperature
-        wqa[kg/s/m**2]: float
+        wqa[kg/s/m**2]: float or np.ndarray
             specific mass flow
         tol[]: float
             numerical precision
         subsonic[]: bool
             whether to find the subsonic or supersonic solution
         """
+        pt, tt, wqa = np.broadcast_arrays(
+            np.asarray(pt, dtype=float), np.asarray(tt, dtype=float), np.asarray(wqa, dtype=float)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = wqa / self.wqa_crit(pt, tt, tol)
+            s = np.sqrt(np.maximum(1.0 - ratio, 0.0))
+
+            spline = self._mach_f_wqa_table[0 if subsonic else 1]
+            s_min, s_max = self._WQA_TABLE_S_MIN, spline.x[-1]
+            in_table = (wqa > 0.0) & (ratio < 1.0) & (s >= s_min) & (s <= s_max)
+
+            # interpolation and Newton polish on log(wqa), the slope being exact for a constant
+            # gamma, then secant steps
+            mach = spline(np.clip(s, s_min, s_max))
+            previous = None
+            for _ in range(self._WQA_NEWTON_MAXITER):
+                ts = self.static_t(tt, mach, tol)
+                ps = pt * self.pr(tt, ts, 1.0)
+                residue = np.log(self.density(ps, ts) * mach * self.c(ts) / wqa)
+                k = 0.5 * (self.gamma(ts) - 1.0)
+                slope = (1.0 - mach**2) / (mach * (1.0 + k * mach**2))
+                if previous is not None:
+                    mach_prev, residue_prev = previous
+                    secant = (residue - residue_prev) / (mach - mach_prev)
+                    slope = np.where(np.isfinite(secant) & (secant != 0.0), secant, slope)
+                previous = mach, residue
+
+                dmach = -residue / slope
+                mach = mach + dmach
+                converged = np.abs(dmach) <= tol
+                if np.all(converged | ~in_table):
+                    break
+
+        mach = np.where(wqa <= 0.0, 0.0, np.where(ratio >= 1.0, 1.0, mach))
+
+        fallback = (~in_table & (wqa > 0.0) & (ratio < 1.0)) | (in_table & ~converged)
+        if np.any(fallback):
+            mach[fallback] = self._mach_f_wqa_bracket(
+                pt[fallback], tt[fallback], wqa[fallback], tol, subsonic
+            )
+
+        return _as_output(mach)
+
+    def _mach_f_wqa_bracket(
+        self, pt: np.ndarray, tt: np.ndarray, wqa: np.ndarray, tol: float, subsonic: bool
+    ) -> np.ndarray:
+        """Mach number from specific mass flow, using a bracketed search."""
 
         # TODO : remove when supersonic case will be handled by `pythermo`
         def f(mach):
-            ts = self.static_t(tt, mach)
+            ts = self.static_t(tt, mach, tol)
             ps = pt * self.pr(tt, ts, 1.0)
             return mach * self.c(ts) - wqa / self.density(ps, ts)
 
-        try:
-            if subsonic:
-                m = toms748(f, 0.0, 1.0)
-            else:
-                m = toms748(f, 1.0, 10.0)
-        except ValueError:
-            m = 1.0
+        if subsonic:
+            m, valid = _solve_bracket(f, np.zeros_like(tt), np.ones_like(tt))
+        else:
+            m, valid = _solve_bracket(f, np.ones_like(tt), np.full_like(tt, 10.0))
 
-        return m
+        return np.where(valid, m, 1.0)
 
-    def mach_f_ptpstt(self, pt: float, ps: float, tt: float, tol: float) -> float:
+    @memoized
+    def mach_f_ptpstt(self, pt: ArrayLike, ps: ArrayLike, tt: ArrayLike, tol: float) -> ArrayLike:
         """Mach number.
 
-        pt[Pa]: float
+        The isentropic relation at total temperature provides the initial guess, refined by
+        safeguarded Newton iterations. Elements which do not converge are solved by a
+        bracketed search.
+        Elements for which the static pressure is not lower than the total one get a zero
+        Mach number.
+
+        pt[Pa]: float or np.ndarray
             total pressure
-        ps[Pa]: float
+        ps[Pa]: float or np.ndarray
             static pressure
-        tt[K]: float
+        tt[K]: float or np.ndarray
             total temperature
         tol[]: float
             numerical precision
         """
+        pt, ps, tt = np.broadcast_arrays(
+            np.asarray(pt, dtype=float), np.asarray(ps, dtype=float), np.asarray(tt, dtype=float)
+        )
+        expanded = ps < pt
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gamma = self.gamma(tt)
+            mach = np.sqrt(
+                2.0 / (gamma - 1.0) * np.maximum((pt / ps) ** ((gamma - 1.0) / gamma) - 1.0, 0.0)
+            )
+            mach = np.where(expanded, np.clip(mach, 0.0, self._PTPS_MACH_MAX), 0.0)
+
+            # Newton iterations on log(ps) with d(log(ps))/dmach = -gamma * mach / (1 + k mach**2)
+            active = expanded.copy()
+            for _ in range(self._PTPS_MAXITER):
+                if not np.any(active):
+                    break
 
-        def f(mach: np.ndarray) -> float:
-            mach = mach.item()
+                ts = self.static_t(tt, mach, tol)
+                gamma = self.gamma(ts)
+                k = 0.5 * (gamma - 1.0)
+                residue = np.log(pt * self.pr(tt, ts, 1.0) / ps)
+                dmach = residue * (1.0 + k * mach**2) / (gamma * mach)
+                dmach = np.where(active & np.isfinite(dmach), dmach, 0.0)
+
+                new_mach = np.clip(
+                    mach + dmach, 0.5 * mach, np.minimum(2.0 * mach, self._PTPS_MACH_MAX)
+                )
+                active &= ~(np.abs(new_mach - mach) <= tol * np.maximum(mach, 1.0))
+                mach = new_mach
+
+        if np.any(active):
+            mach[active] = self._mach_f_ptpstt_bracket(pt[active], ps[active], tt[active], tol)
+
+        return _as_output(mach)
+
+    def _mach_f_ptpstt_bracket(
+        self, pt: np.ndarray, ps: np.ndarray, tt: np.ndarray, tol: float
+    ) -> np.ndarray:
+        """Mach number from pressure ratio, using a bracketed search."""
+
+        def f(mach):
             ts = self.static_t(tt, mach, tol)
             ps_it = pt * self.pr(tt, ts, 1.0)
             return ps - ps_it
 
-        solution = root(f, x0=[0.5], method="hybr")
-        return solution.x.item()
+        m, valid = _solve_bracket(f, np.zeros_like(tt), np.full_like(tt, 10.0))
+
+        return np.where(valid, m, 0.0)
@@ -1,10 +1,9 @@
 # Copyright (C) 2025, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-import ambiance
 from cosapp.base import System
 
-from pyturbo.thermo import IdealDryAir
+from pyturbo.thermo import IdealDryAir, shared_gas, standard_atmosphere
 
 
 def init_environment(
@@ -12,10 +11,9 @@ def init_environment(
 ):
     """Init fluid data with mission values."""
 
-    gas = IdealDryAir()
-    atm = ambiance.Atmosphere(alt)
-    pamb = atm.pressure[0]
-    tamb = atm.temperature[0] + dtamb
+    gas = shared_gas(IdealDryAir)
+    pamb, tamb = standard_atmosphere().state(alt)
+    tamb += dtamb
 
     if "pamb" in sys:
         sys.pamb = pamb
@@ -0,0 +1,125 @@
+# Copyright (C) 2025, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from functools import cached_property, lru_cache
+from typing import List, Optional, Tuple, Union
+
+import ambiance
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class StandardAtmosphere:
+    """International Standard Atmosphere with memoized and tabulated lookups.
+
+    Scalar altitudes are computed with `ambiance` and memoized, since altitude is constant
+    over a solve. Altitude arrays are interpolated in per-layer tables of geopotential
+    altitude built once: temperature is linear in each layer, so it is exact, and
+    log-pressure is interpolated by cubic Hermite polynomials using
+    `d(log(p))/dH = -g0 / (R T)`. The relative error on pressure is below 1e-9 with the
+    default step.
+
+    Parameters
+    ----------
+    step[m]: float, default=100.0
+        geopotential altitude step of the tables
+    maxsize[-]: int, default=1024
+        maximum number of memoized scalar altitudes
+    """
+
+    def __init__(self, step: float = 100.0, maxsize: int = 1024):
+        self.step = step
+        self._exact = lru_cache(maxsize)(self._exact_state)
+
+    @staticmethod
+    def _exact_state(altitude: float) -> Tuple[float, float]:
+        atm = ambiance.Atmosphere(altitude)
+        return atm.pressure[0], atm.temperature[0]
+
+    @cached_property
+    def _tables(self) -> Tuple[np.ndarray, List[tuple]]:
+        """Per-layer tables, since layer base pressures are rounded in the standard."""
+        const = ambiance.CONST
+        H_min, H_max = ambiance.Atmosphere.geom2geop_height([const.h_min, const.h_max])
+        bases = [layer["H_base"] for layer in const.LAYER_DICTS.values()]
+        edges = np.unique(np.clip(np.r_[H_min, bases, H_max], H_min, H_max))
+
+        layers = []
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            # end nodes are shifted inside the layer, robustly to height conversions round-off
+            H = np.union1d(np.arange(lo, hi, self.step)[1:], [lo + 1e-6, hi - 1e-6])
+            atm = ambiance.Atmosphere(ambiance.Atmosphere.geop2geom_height(H))
+            t = atm.temperature
+            dlogp = -const.g_0 / (const.R * t)
+            beta = (t[-1] - t[0]) / (H[-1] - H[0])
+            layers.append((H[0], t[0], beta, CubicHermiteSpline(H, np.log(atm.pressure), dlogp)))
+
+        return edges, layers
+
+    def cache_info(self):
+        """Return the hit/miss statistics of the scalar altitude memo."""
+        return self._exact.cache_info()
+
+    def state(self, altitude: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """Ambient static pressure and temperature.
+
+        altitude[m]: float or np.ndarray
+            geometric altitude
+
+        Returns
+        -------
+        pressure[Pa]: float or np.ndarray
+            static pressure
+        temperature[K]: float or np.ndarray
+            static temperature
+        """
+        if np.ndim(altitude) == 0:
+            return self._exact(float(altitude))
+
+        altitude = np.asarray(altitude, dtype=float)
+        const = ambiance.CONST
+        if np.any(altitude < const.h_min) or np.any(altitude > const.h_max):
+            raise ValueError(f"Altitude out of bounds [{const.h_min:.0f}, {const.h_max:.0f}] m.")
+
+        edges, layers = self._tables
+        H = np.clip(ambiance.Atmosphere.geom2geop_height(altitude), edges[0], edges[-1])
+        index = np.clip(np.searchsorted(edges, H, side="right") - 1, 0, len(layers) - 1)
+
+        pressure = np.empty_like(H)
+        temperature = np.empty_like(H)
+        for i, (H_base, t_base, beta, logp) in enumerate(layers):
+            mask = index == i
+            pressure[mask] = np.exp(logp(H[mask]))
+            temperature[mask] = t_base + beta * (H[mask] - H_base)
+
+        return pressure, temperature
+
+    def pressure(self, altitude: ArrayLike) -> ArrayLike:
+        """Ambient static pressure.
+
+        altitude[m]: float or np.ndarray
+            geometric altitude
+        """
+        return self.state(altitude)[0]
+
+    def temperature(self, altitude: ArrayLike) -> ArrayLike:
+        """Ambient static temperature.
+
+        altitude[m]: float or np.ndarray
+            geometric altitude
+        """
+        return self.state(altitude)[1]
+
+
+_standard_atmosphere: Optional[StandardAtmosphere] = None
+
+
+def standard_atmosphere() -> StandardAtmosphere:
+    """Return the shared `StandardAtmosphere` instance."""
+    global _standard_atmosphere
+
+    if _standard_atmosphere is None:
+        _standard_atmosphere = StandardAtmosphere()
+    return _standard_atmosphere
@@ -2,30 +2,82 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 
+from pyturbo.utils.batch import run_once_batch
+from pyturbo.utils.continuation import continuation
 from pyturbo.utils.coords import rz_to_3d, slope_to_3d, slope_to_drdz
+from pyturbo.utils.jacobian import (
+    AdaptiveJacobian,
+    ChainRuleJacobian,
+    ColoredJacobian,
+    color_columns,
+    jacobian_sparsity,
+)
 from pyturbo.utils.json_io import load_from_json, save_to_json
+from pyturbo.utils.lru_cache import CacheInfo, LRUCache
+from pyturbo.utils.recorder import ColumnRecorder, read_columns
+from pyturbo.utils.shape_cache import ShapeCache, cached_shape, shape_cache
+from pyturbo.utils.snapshot import load_snapshot, save_snapshot
+from pyturbo.utils.state import (
+    dumps_state,
+    get_state,
+    is_converged,
+    loads_state,
+    set_state,
+    solver_unknowns,
+)
+from pyturbo.utils.sweep import grid, sweep
+from pyturbo.utils.template import SystemTemplate
 from pyturbo.utils.view_tools import (
     create_arrow,
     create_box,
     create_cone,
     create_cylinder,
     create_sphere,
+    occ_available,
     rotate,
     translate,
 )
+from pyturbo.utils.warm_start import WarmStartCache
 
 __all__ = [
     "add_nacelle_brand",
+    "run_once_batch",
     "rz_to_3d",
     "slope_to_drdz",
     "slope_to_3d",
     "load_from_json",
     "save_to_json",
+    "load_snapshot",
+    "save_snapshot",
+    "get_state",
+    "set_state",
+    "dumps_state",
+    "loads_state",
+    "is_converged",
+    "solver_unknowns",
+    "grid",
+    "sweep",
+    "WarmStartCache",
+    "ColumnRecorder",
+    "read_columns",
+    "SystemTemplate",
+    "continuation",
+    "AdaptiveJacobian",
+    "ChainRuleJacobian",
+    "ColoredJacobian",
+    "color_columns",
+    "jacobian_sparsity",
+    "CacheInfo",
+    "LRUCache",
+    "ShapeCache",
+    "cached_shape",
+    "shape_cache",
     "create_arrow",
     "create_box",
     "create_cone",
     "create_cylinder",
     "create_sphere",
+    "occ_available",
     "rotate",
     "translate",
 ]
@@ -0,0 +1,47 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from typing import Dict, Iterable
+
+import numpy as np
+from cosapp.systems import System
+
+
+def run_once_batch(
+    system: System, inputs: Dict[str, np.ndarray], outputs: Iterable[str]
+) -> Dict[str, np.ndarray]:
+    """Run `system.run_once()` over N operating points at once.
+
+    Input variables are set to 1-D arrays of size N, so that port variables hold arrays and
+    each compute evaluates all points in one vectorized pass. Scalar inputs are broadcast.
+    Input values are restored afterwards, computed variables keep their batch values until the
+    next run.
+
+    Parameters
+    ----------
+    system: System
+        system to run
+    inputs: dict[str, np.ndarray]
+        input values, keyed by variable path relative to `system`
+    outputs: iterable of str
+        variable paths to collect
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        collected outputs, each of size N
+    """
+    values = {name: np.asarray(value, dtype=float) for name, value in inputs.items()}
+    shape = np.broadcast_shapes(*(value.shape for value in values.values()))
+    if len(shape) != 1:
+        raise ValueError(f"Batch inputs must be 1-D arrays, got shape {shape}.")
+
+    backup = {name: system[name] for name in values}
+    try:
+        for name, value in values.items():
+            system[name] = np.broadcast_to(value, shape).copy()
+        system.run_once()
+        return {name: np.broadcast_to(system[name], shape).copy() for name in outputs}
+    finally:
+        for name, value in backup.items():
+            system[name] = value
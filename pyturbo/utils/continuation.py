@@ -0,0 +1,132 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from cosapp.systems import System
+
+from pyturbo.utils.state import get_state, is_converged, set_state, solver_unknowns
+
+
+def _solver_calls(system: System) -> int:
+    """Return the number of residue evaluations of the last run of the `system` drivers."""
+    calls = 0
+    for driver in system.drivers.values():
+        for d in driver.tree():
+            results = getattr(d, "results", None)
+            if results is not None:
+                calls += results.fres_calls
+    return calls
+
+
+def _solve(system: System) -> bool:
+    try:
+        system.run_drivers()
+    except Exception:
+        return False
+    return is_converged(system)
+
+
+def continuation(
+    system: System,
+    parameter: str,
+    stop: float,
+    outputs: Iterable[str] = (),
+    step: Optional[float] = None,
+    min_step: Optional[float] = None,
+    max_step: Optional[float] = None,
+    target_calls: int = 8,
+) -> Dict[str, np.ndarray]:
+    """Walk `parameter` from its current value to `stop` with predictor-corrector steps.
+
+    At each step, the unknowns of the system drivers are extrapolated from the two previous
+    solutions (secant predictor) and corrected by the drivers. The step grows when the
+    correction takes less than `target_calls` residue evaluations, shrinks when it takes more
+    than twice, and is halved from the last solution if the correction fails.
+
+    Parameters
+    ----------
+    system: System
+        system to run, with its drivers
+    parameter: str
+        path of the parameter, e.g. "fuel_W"
+    stop: float
+        final value of the parameter
+    outputs: iterable of str
+        variable paths to collect at each step
+    step: float, optional
+        initial step, default is a tenth of the path
+    min_step: float, optional
+        smallest step before giving up, default is a thousandth of the path
+    max_step: float, optional
+        largest step, default is a quarter of the path
+    target_calls: int, default=8
+        residue evaluations per correction the step size is adapted to
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        columns of the parameter, of the outputs and of the residue evaluations per step
+
+    Raises
+    ------
+    RuntimeError
+        if the initial solve fails or the step becomes smaller than `min_step`
+    """
+    value = float(system[parameter])
+    length = abs(stop - value)
+    direction = np.sign(stop - value)
+    step = step or 0.1 * length
+    min_step = min_step or 1e-3 * length
+    max_step = max_step or 0.25 * length
+
+    outputs = list(outputs)
+    data = {name: [] for name in [parameter, *outputs, "solver_calls"]}
+
+    def record():
+        data[parameter].append(float(system[parameter]))
+        for name in outputs:
+            data[name].append(system[name])
+        data["solver_calls"].append(_solver_calls(system))
+
+    if not _solve(system):
+        raise RuntimeError(f"Initial solve failed at {parameter} = {value}.")
+    record()
+
+    unknowns = solver_unknowns(system)
+    state = get_state(system)
+    current = [np.array(system[name], dtype=float) for name in unknowns]
+    previous, previous_value = None, None
+
+    while direction * (stop - value) > 0.0:
+        h = min(step, abs(stop - value))
+        new_value = value + direction * h
+
+        system[parameter] = new_value
+        if previous is not None:
+            ratio = (new_value - value) / (value - previous_value)
+            for name, x, x_prev in zip(unknowns, current, previous):
+                x_new = x + ratio * (x - x_prev)
+                system[name] = x_new if np.ndim(system[name]) else float(x_new)
+
+        if not _solve(system):
+            set_state(system, state)
+            step = 0.5 * h
+            if step < min_step:
+                raise RuntimeError(f"Continuation failed at {parameter} = {new_value}.")
+            continue
+
+        record()
+        calls = data["solver_calls"][-1]
+        if calls <= target_calls:
+            step = min(1.5 * h, max_step)
+        elif calls > 2 * target_calls:
+            step = max(0.5 * h, min_step)
+
+        previous, previous_value = current, value
+        current = [np.array(system[name], dtype=float) for name in unknowns]
+        value = new_value
+        state = get_state(system)
+
+    return {name: np.asarray(values) for name, values in data.items()}
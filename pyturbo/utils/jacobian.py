@@ -0,0 +1,566 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Jacobian evaluations of `NonLinearSolver` problems.
+
+`ChainRuleJacobian` and `ColoredJacobian` extend cosapp `FfdJacobianEvaluation` and read
+private cosapp attributes (`_fun`, `_eps`, `_fresidues`, `_sequential_evaluation`, and
+`_wrapped` and `_unit_conversions` of connectors). They are written against cosapp 1.6, which
+is pinned in the requirements, and raise `AttributeError` if one of these attributes is
+missing, rather than computing a wrong Jacobian matrix.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from cosapp.core.numerics.basics import MathematicalProblem
+from cosapp.core.numerics.solve import (
+    AbstractJacobianEvaluation,
+    FfdJacobianEvaluation,
+    JacobianStats,
+)
+from cosapp.drivers import NonLinearSolver, RunSingleCase
+from cosapp.ports.connectors import Connector
+from cosapp.ports.port import BasePort
+from cosapp.systems import System
+
+VarKey = Tuple[int, str]
+
+_COSAPP_VERSION = ">=1.6.2,<1.7"
+
+
+def _internal(obj, name: str):
+    """Return the private cosapp attribute `name` of `obj`, see the module docstring."""
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        raise AttributeError(
+            f"{type(obj).__name__!r} object has no attribute {name!r}; "
+            f"pyturbo Jacobian evaluations are written against cosapp{_COSAPP_VERSION}."
+        ) from None
+
+
+def _check_internals(jacobian: FfdJacobianEvaluation):
+    """Check that the private cosapp attributes used by `jacobian` exist."""
+    for name in ("_fun", "_eps", "_fresidues"):
+        _internal(jacobian, name)
+    _internal(FfdJacobianEvaluation, "_sequential_evaluation")
+
+
+def _solver(jacobian: FfdJacobianEvaluation) -> Optional[NonLinearSolver]:
+    """Return the solver of a single-point problem bound to `jacobian`, if any."""
+    driver = getattr(_internal(jacobian, "_fun"), "__self__", None)
+    if not isinstance(driver, NonLinearSolver) or any(
+        isinstance(child, RunSingleCase) for child in driver.children.values()
+    ):
+        return None
+    return driver
+
+
+def _natural_name(port: BasePort, name: str) -> str:
+    """Return the variable name relative to the port owner, as used in equations."""
+    return name if port.name in ("inwards", "outwards") else f"{port.name}.{name}"
+
+
+def _is_numeric(value) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "fi"
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+def _has_compute(system: System) -> bool:
+    return type(system).compute is not System.compute
+
+
+def _resolve(system: System, name: str) -> Tuple[BasePort, str]:
+    ref = system.name2variable[name]
+    return ref.mapping, ref.key
+
+
+def _variables(ports: Iterable[BasePort]) -> List[Tuple[BasePort, str]]:
+    return [
+        (port, name)
+        for port in ports
+        if port.name != "modevars_in"
+        for name, value in port.items()
+        if _is_numeric(value)
+    ]
+
+
+def _compute_inputs(system: System) -> List[Tuple[BasePort, str]]:
+    """Return the variables the compute of `system` may read."""
+    ports = list(system.inputs.values())
+    if system.children:
+        # assembly computes may read any variable of their sub-systems
+        for child in system.tree():
+            if child is not system:
+                ports.extend(child.inputs.values())
+                ports.extend(child.outputs.values())
+    return _variables(ports)
+
+
+def _seed(problem: MathematicalProblem) -> Tuple[Dict[VarKey, np.ndarray], Set[VarKey]]:
+    """Return the derivatives of the unknowns of `problem` with respect to themselves."""
+    size = sum(unknown.size for unknown in problem.unknowns.values())
+    tangents = {}
+    column = 0
+    for unknown in problem.unknowns.values():
+        port, name = unknown.port, unknown.variable
+        key = (id(port), name)
+        tangent = tangents.setdefault(key, np.zeros((np.size(port[name]), size)))
+        indices = np.flatnonzero(unknown.mask) if unknown.mask is not None else [0]
+        for i in indices:
+            tangent[i, column] = 1.0
+            column += 1
+
+    return tangents, set(tangents)
+
+
+def _transfer(connector, tangents: Dict[VarKey, np.ndarray], seeds: Set[VarKey]):
+    if not connector.is_active:
+        return
+
+    # only `Connector` converts units
+    connector = _internal(connector, "_wrapped")
+    conversions = (
+        _internal(connector, "_unit_conversions") if isinstance(connector, Connector) else {}
+    )
+    source_id, sink_id = id(connector.source), id(connector.sink)
+    for target, origin in connector.mapping.items():
+        key = (sink_id, target)
+        if key in seeds:
+            continue
+
+        tangent = tangents.get((source_id, origin))
+        if tangent is None:
+            tangents.pop(key, None)
+        else:
+            factor = (conversions.get(target) or (1.0, 0.0))[0]
+            tangents[key] = factor * tangent
+
+
+def _forward(
+    system: System,
+    tangents: Dict[VarKey, np.ndarray],
+    seeds: Set[VarKey],
+    propagate: Callable[[System], None],
+):
+    """Propagate derivatives through `system`, as `System.run_once` does with values.
+
+    Connectors transfer derivatives, `propagate` is called in place of each compute.
+    """
+    if not system.is_active():
+        return
+
+    child_connectors: Dict[str, list] = {}
+    pulling = []
+    for connector in system.connectors().values():
+        owner = connector.sink.owner
+        if owner is system:
+            pulling.append(connector)
+        else:
+            child_connectors.setdefault(owner.name, []).append(connector)
+
+    for child in system.children.values():
+        for connector in child_connectors.get(child.name, []):
+            _transfer(connector, tangents, seeds)
+        _forward(child, tangents, seeds, propagate)
+
+    for connector in pulling:
+        _transfer(connector, tangents, seeds)
+
+    if _has_compute(system):
+        propagate(system)
+
+
+def jacobian_sparsity(problem: MathematicalProblem) -> sp.csr_matrix:
+    """Return the structure of the Jacobian matrix of `problem`.
+
+    The dependencies of the residues on the unknowns are traced through the connectors and
+    computes of the problem context, in execution order. A compute is assumed to couple all its
+    inputs to all its outputs, unless its system exposes `partials()`, whose keys then give
+    the couplings. The structure is therefore conservative.
+
+    Parameters
+    ----------
+    problem: MathematicalProblem
+        problem of a `NonLinearSolver`, assembled by a run of the solver
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        boolean matrix, True where a residue may depend on an unknown
+    """
+    tangents, seeds = _seed(problem)
+    size = sum(unknown.size for unknown in problem.unknowns.values())
+
+    def propagate(system: System):
+        inputs = [var for var in _compute_inputs(system) if (id(var[0]), var[1]) in tangents]
+        if not inputs:
+            return
+
+        couplings = None
+        partials = getattr(system, "partials", None)
+        if partials is not None and not system.children:
+            couplings = partials()
+            if any(_natural_name(port, name) not in couplings for port, name in inputs):
+                couplings = None
+
+        if couplings is None:
+            # outputs pulled from sub-systems are assumed untouched by assembly computes
+            pulled = {
+                (id(connector.sink), target)
+                for connector in system.connectors().values()
+                if connector.sink.owner is system
+                for target in connector.mapping
+            }
+            dependencies = np.any([tangents[(id(p), n)].any(axis=0) for p, n in inputs], axis=0)
+            for port, name in _variables(system.outputs.values()):
+                key = (id(port), name)
+                if key not in seeds and key not in pulled:
+                    tangents[key] = np.tile(dependencies, (np.size(port[name]), 1))
+            return
+
+        new_tangents: Dict[VarKey, np.ndarray] = {}
+        for port, name in inputs:
+            dependencies = tangents[(id(port), name)].any(axis=0)
+            for of in couplings[_natural_name(port, name)]:
+                out_port, out_name = _resolve(system, of)
+                key = (id(out_port), out_name)
+                if key not in seeds:
+                    tangent = new_tangents.setdefault(
+                        key, np.zeros((np.size(out_port[out_name]), size), dtype=bool)
+                    )
+                    tangent |= dependencies
+        tangents.update(new_tangents)
+
+    _forward(problem.context, tangents, seeds, propagate)
+
+    rows = []
+    for residue in problem.residues.values():
+        dependencies = np.zeros(size, dtype=bool)
+        for varname in residue.variables:
+            try:
+                port, name = _resolve(residue.context, varname)
+            except KeyError:
+                dependencies[:] = True
+                break
+            tangent = tangents.get((id(port), name))
+            if tangent is not None:
+                dependencies |= tangent.any(axis=0)
+        rows.append(np.tile(dependencies, (np.size(residue.value), 1)))
+
+    structure = np.vstack(rows) if rows else np.zeros((0, size), dtype=bool)
+    return sp.csr_matrix(structure)
+
+
+def color_columns(structure: sp.spmatrix) -> Dict[int, List[int]]:
+    """Group the columns of a sparse matrix which share no row.
+
+    All columns of a group can be perturbed in a single residue evaluation of a finite
+    difference Jacobian. Groups are built greedily, largest columns first.
+
+    Returns
+    -------
+    dict[int, list[int]]
+        column indices of each group
+    """
+    structure = sp.csc_matrix(structure, dtype=bool)
+    n_rows, n_cols = structure.shape
+    counts = np.diff(structure.indptr)
+    groups: Dict[int, List[int]] = {}
+    rows_used: List[np.ndarray] = []
+
+    for j in np.argsort(-counts, kind="stable"):
+        rows = structure.indices[structure.indptr[j] : structure.indptr[j + 1]]
+        for color, used in enumerate(rows_used):
+            if not used[rows].any():
+                break
+        else:
+            color = len(rows_used)
+            rows_used.append(np.zeros(n_rows, dtype=bool))
+
+        rows_used[color][rows] = True
+        groups.setdefault(color, []).append(int(j))
+
+    return groups
+
+
+class ColoredJacobian(FfdJacobianEvaluation):
+    """Finite difference Jacobian of a `NonLinearSolver` problem, by groups of unknowns.
+
+    The Jacobian structure is computed by `jacobian_sparsity` when the problem changes, then
+    unknowns influencing disjoint residues are perturbed together. Combine with a sparse linear
+    solver to also factorize the Jacobian matrix as a sparse one.
+
+    Examples
+    --------
+    >>> from cosapp.core.numerics.solve import SparseLUSolver
+    >>> sys.add_driver(
+    ...     NonLinearSolver("solver", jac=ColoredJacobian(), linear_solver=SparseLUSolver())
+    ... )
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _check_internals(self)
+        self._problem_key = None
+
+    def __call__(self, x0: np.ndarray, **kwargs) -> np.ndarray:
+        driver = _solver(self)
+        if driver is not None:
+            problem = driver.problem
+            key = (id(problem), tuple(problem.unknowns), tuple(problem.residues))
+            if key != self._problem_key:
+                structure = jacobian_sparsity(problem)
+                self.sparsity = structure, color_columns(structure)
+                self._problem_key = key
+
+        return super().__call__(x0, **kwargs)
+
+
+class ChainRuleJacobian(FfdJacobianEvaluation):
+    """Jacobian of a `NonLinearSolver` problem assembled by chain rule.
+
+    Derivatives of the unknowns are propagated forward through connectors and computes, in
+    execution order, then combined with derivatives of the residues. Systems exposing a
+    `partials()` method, returning derivatives `d[wrt][of]` of their outputs with respect to
+    their inputs, are differentiated analytically; other systems are differentiated by finite
+    differences of their own compute only. A Jacobian therefore costs about one evaluation of
+    the whole system.
+
+    Partial Jacobian and Broyden updates are handled as in `FfdJacobianEvaluation`, the
+    multi-point problems fall back to its full finite differences.
+
+    Examples
+    --------
+    >>> sys.add_driver(NonLinearSolver("solver", jac=ChainRuleJacobian()))
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _check_internals(self)
+
+    def _sequential_evaluation(
+        self,
+        jac: np.ndarray,
+        x0: np.ndarray,
+        r0: np.ndarray,
+        x_indices_to_update: Iterable[int],
+    ) -> None:
+        driver = _solver(self)
+        if driver is None:
+            super()._sequential_evaluation(jac, x0, r0, x_indices_to_update)
+            return
+
+        # the model may not have been run at x0 yet
+        self._fresidues(x0)
+        indices = list(x_indices_to_update)
+        jac[:, indices] = self.assemble(driver.problem)[:, indices]
+
+    def assemble(self, problem: MathematicalProblem) -> np.ndarray:
+        """Return the Jacobian matrix of the residues of `problem` at the current point."""
+        self._tangents, self._seeds = _seed(problem)
+        _forward(problem.context, self._tangents, self._seeds, self._propagate)
+
+        size = sum(unknown.size for unknown in problem.unknowns.values())
+        rows = [self._residue_derivative(residue, size) for residue in problem.residues.values()]
+        self._tangents.clear()
+
+        return np.vstack(rows) if rows else np.zeros((0, size))
+
+    def _propagate(self, system: System):
+        """Propagate derivatives through the compute of `system`."""
+        inputs = [var for var in _compute_inputs(system) if (id(var[0]), var[1]) in self._tangents]
+        outputs = _variables(system.outputs.values())
+
+        derivatives = None
+        partials = getattr(system, "partials", None)
+        if inputs and partials is not None and not system.children:
+            derivatives = partials()
+            if any(_natural_name(port, name) not in derivatives for port, name in inputs):
+                derivatives = None
+
+        new_tangents: Dict[VarKey, np.ndarray] = {}
+
+        def accumulate(port, name, d, tangent):
+            key = (id(port), name)
+            if key in self._seeds:
+                return
+            out_size = np.size(port[name])
+            d = np.reshape(d, (out_size, tangent.shape[0]))
+            value = new_tangents.get(key)
+            new_tangents[key] = d @ tangent if value is None else value + d @ tangent
+
+        if derivatives is not None:
+            for port, name in inputs:
+                tangent = self._tangents[(id(port), name)]
+                for of, d in derivatives[_natural_name(port, name)].items():
+                    out_port, out_name = _resolve(system, of)
+                    accumulate(out_port, out_name, d, tangent)
+
+        elif inputs:
+            reference = [np.array(port[name], dtype=float) for port, name in outputs]
+            for port, name in inputs:
+                tangent = self._tangents[(id(port), name)]
+                value = np.array(port[name], dtype=float)
+                for i in range(value.size):
+                    x = value.ravel()[i]
+                    delta = self._eps * x if abs(x) > self._eps else self._eps
+                    perturbed = value.copy()
+                    perturbed.ravel()[i] += delta
+                    port[name] = perturbed if value.ndim else float(perturbed)
+                    system.compute()
+                    for (out_port, out_name), ref in zip(outputs, reference):
+                        d = (np.asarray(out_port[out_name], dtype=float) - ref) / delta
+                        if np.any(d != 0.0):
+                            accumulate(out_port, out_name, d, tangent[i : i + 1])
+                port[name] = value if value.ndim else float(value)
+
+            for (port, name), ref in zip(outputs, reference):
+                port[name] = ref if ref.ndim else float(ref)
+
+        # outputs left untouched by the compute keep the derivatives pulled from sub-systems
+        self._tangents.update(new_tangents)
+
+    def _residue_derivative(self, residue, size: int) -> np.ndarray:
+        """Return the derivatives of `residue` with respect to the unknowns."""
+        value = np.array(residue.value, dtype=float)
+        row = np.zeros((value.size, size))
+        context = residue.context
+
+        for varname in residue.variables:
+            try:
+                port, name = _resolve(context, varname)
+            except KeyError:
+                continue
+            tangent = self._tangents.get((id(port), name))
+            if tangent is None:
+                continue
+
+            x = np.array(port[name], dtype=float)
+            for i in range(x.size):
+                xi = x.ravel()[i]
+                delta = self._eps * xi if abs(xi) > self._eps else self._eps
+                perturbed = x.copy()
+                perturbed.ravel()[i] += delta
+                port[name] = perturbed if x.ndim else float(perturbed)
+                d = (np.array(residue.update(), dtype=float) - value) / delta
+                row += np.outer(d.ravel(), tangent[i])
+            port[name] = x if x.ndim else float(x)
+            residue.update()
+
+        return row
+
+
+class AdaptiveJacobian(AbstractJacobianEvaluation):
+    """Jacobian evaluation reusing the Jacobian matrix while the solver converges fast.
+
+    The Jacobian matrix of a `NonLinearSolver` is kept from one run to the next after a
+    successful resolution. Each time the solver requests a new one, the matrix only gets a
+    rank-one Broyden update if the residue norm decreased by at least `rate` over the last
+    iteration; otherwise, `jac` evaluates it. On sweeps, consecutive cases thus mostly solve
+    with an updated Jacobian of the previous case.
+
+    Parameters
+    ----------
+    jac: AbstractJacobianEvaluation, optional
+        evaluation used when the convergence rate degrades, default is `FfdJacobianEvaluation`
+    rate: float, default=0.2
+        largest ratio of consecutive residue norms accepted for a Broyden update
+
+    Attributes
+    ----------
+    stats: JacobianStats
+        partial, Broyden and full updates, over all runs; Broyden updates include the
+        Jacobian evaluations replaced by the reuse
+
+    Examples
+    --------
+    >>> jac = AdaptiveJacobian(ColoredJacobian())
+    >>> sys.add_driver(NonLinearSolver("solver", jac=jac))
+    >>> sweep(...)
+    >>> jac.stats
+    """
+
+    def __init__(self, jac: Optional[AbstractJacobianEvaluation] = None, rate: float = 0.2):
+        if not 0.0 < rate < 1.0:
+            raise ValueError(f"Convergence rate must be in ]0, 1[, got {rate}.")
+
+        super().__init__()
+        self.jac = FfdJacobianEvaluation() if jac is None else jac
+        self.rate = rate
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset the statistics of all runs."""
+        self.jac.reset_stats()
+        self._broyden_updates = 0
+        self._totals = JacobianStats(0, 0, 0)
+
+    @property
+    def stats(self) -> JacobianStats:
+        current = self.get_stats()
+        return JacobianStats(*(a + b for a, b in zip(self._totals, current)))
+
+    def get_stats(self) -> JacobianStats:
+        partial, broyden, full = self.jac.get_stats()
+        return JacobianStats(partial, broyden + self._broyden_updates, full)
+
+    @property
+    def sparsity(self):
+        return getattr(self.jac, "sparsity", None)
+
+    @sparsity.setter
+    def sparsity(self, value):
+        self.jac.sparsity = value
+
+    @AbstractJacobianEvaluation.log_level.setter
+    def log_level(self, value):
+        AbstractJacobianEvaluation.log_level.fset(self, value)
+        self.jac.log_level = value
+
+    def bind_residue_function(self, f, args):
+        super().bind_residue_function(f, args)
+        self.jac.bind_residue_function(f, args)
+
+    def unbind_residue_function(self):
+        super().unbind_residue_function()
+        self.jac.unbind_residue_function()
+
+    def setup(self, size: int):
+        # the wrapped evaluation resets its statistics at setup
+        self._totals = self.stats
+        self._broyden_updates = 0
+        self.jac.setup(size)
+
+    def teardown(self):
+        self.jac.teardown()
+
+    def __call__(
+        self,
+        x0: np.ndarray,
+        *,
+        r0: Optional[np.ndarray] = None,
+        jac: Optional[np.ndarray] = None,
+        dx: Optional[np.ndarray] = None,
+        dr: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        if (
+            jac is not None
+            and jac.shape == (x0.size, x0.size)
+            and r0 is not None
+            and dx is not None
+            and dr is not None
+            and np.all(np.isfinite(dx))
+            and np.dot(dx, dx) > 0.0
+        ):
+            previous = np.linalg.norm(r0 - dr, np.inf)
+            if previous > 0.0 and np.linalg.norm(r0, np.inf) <= self.rate * previous:
+                jac += np.outer(dr - jac @ dx, dx) / np.dot(dx, dx)
+                self._broyden_updates += 1
+                return jac
+
+        return self.jac(x0, r0=r0, jac=jac, dx=dx, dr=dr, **kwargs)
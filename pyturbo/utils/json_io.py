@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import json
+import warnings
 
 import numpy as np
 
@@ -31,20 +32,29 @@ def load_from_json(system, file):
 
 
 def save_to_json(system, file):
-    """Save system data to JSON file."""
+    """Save system data to JSON file.
 
-    def to_dict(system):
+    Variables which are neither numbers nor arrays are not saved, a single warning lists them.
+    """
+    skipped = []
+
+    def to_dict(system, prefix=""):
         def save(name, data, dd):
             if isinstance(data, float) or isinstance(data, int):
                 dd[name] = data
             elif isinstance(data, np.ndarray):
-                dd[name] = data.tolist
+                dd[name] = data.tolist()
             else:
-                print(f"Variable '{name}' of type '{type(data)}' is not saved.")
+                skipped.append(f"{prefix}{name}")
 
         dd = {}
         for _, child in system.children.items():
-            dd.update({f"{child.name}.{name}": data for name, data in to_dict(child).items()})
+            dd.update(
+                {
+                    f"{child.name}.{name}": data
+                    for name, data in to_dict(child, f"{prefix}{child.name}.").items()
+                }
+            )
 
         for name, data in system.inwards.items():
             save(name, data, dd)
@@ -56,6 +66,9 @@ def save_to_json(system, file):
         return dd
 
     data = to_dict(system)
+    if skipped:
+        warnings.warn(f"Variables {skipped} are neither numbers nor arrays, they are not saved.")
+
     try:
         with open(file, "w") as outfile:
             json.dump(data, outfile)
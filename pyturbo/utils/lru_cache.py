@@ -0,0 +1,61 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `LRUCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Bounded LRU cache with hit/miss statistics.
+
+    Parameters
+    ----------
+    maxsize: int
+        maximum number of entries, the least recently used ones are evicted first
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be strictly positive, got {maxsize}.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value of `key`, or `LRUCache._MISSING`."""
+        value = self._data.get(key, self._MISSING)
+        if value is self._MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store `value` for `key`, evicting the least recently used entry if full."""
+        self._data[key] = value
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
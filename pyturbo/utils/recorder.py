@@ -0,0 +1,160 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from cosapp.systems import System
+
+
+class ColumnRecorder:
+    """Record variables of a system in NumPy columns, streamed to disk by chunks.
+
+    Variable paths are resolved once to their ports. Each `record` copies the current values
+    into preallocated column buffers of `chunk_size` rows; full buffers are written to
+    `directory` as `.npz` chunk files, one array per column, so memory stays bounded and
+    columns may be read separately with `read_columns`. Without `directory`, chunks are kept
+    in memory. Integer variables are recorded in float columns, as they may later be set to
+    floats.
+
+    Parameters
+    ----------
+    system: System
+        the recorded system
+    variables: iterable of str
+        variable paths, relative to `system`
+    directory: str or Path, optional
+        directory of the chunk files, created if needed; it must not hold chunk files already
+    chunk_size: int, default=1024
+        number of rows of a chunk
+
+    Examples
+    --------
+    >>> with ColumnRecorder(sys, ["tf.thrust", "tf.sfc"], "results") as recorder:
+    ...     for fuel_W in np.linspace(0.5, 1.0, 100):
+    ...         sys.fuel_W = fuel_W
+    ...         sys.run_drivers()
+    ...         recorder.record()
+    >>> read_columns("results", ["tf.thrust"])
+    """
+
+    def __init__(
+        self,
+        system: System,
+        variables: Iterable[str],
+        directory: Optional[str] = None,
+        chunk_size: int = 1024,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be strictly positive, got {chunk_size}.")
+
+        self.variables = list(variables)
+        self.directory = None if directory is None else Path(directory)
+        self.chunk_size = chunk_size
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if any(self.directory.glob("chunk_*.npz")):
+                raise FileExistsError(f"Directory {str(self.directory)!r} holds chunk files.")
+
+        self._accessors = []
+        self._buffers = {}
+        for name in self.variables:
+            ref = system.name2variable[name]
+            value = np.asarray(ref.mapping[ref.key])
+            dtype = np.result_type(value, float) if value.dtype.kind in "iu" else value.dtype
+            self._accessors.append((ref.mapping, ref.key))
+            self._buffers[name] = np.empty((chunk_size, *value.shape), dtype=dtype)
+
+        self._columns = list(self._buffers.values())
+        self._rows = 0
+        self._chunks = []
+        self.size = 0
+
+    def record(self):
+        """Append the current values of the variables."""
+        i = self._rows
+        for column, (port, key) in zip(self._columns, self._accessors):
+            column[i] = port[key]
+
+        self._rows += 1
+        self.size += 1
+        if self._rows == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the recorded rows which are not yet in a chunk."""
+        if self._rows == 0:
+            return
+
+        chunk = {name: buffer[: self._rows].copy() for name, buffer in self._buffers.items()}
+        if self.directory is None:
+            self._chunks.append(chunk)
+        else:
+            path = self.directory / f"chunk_{len(self._chunks):06d}.npz"
+            np.savez(path, **chunk)
+            self._chunks.append(path)
+        self._rows = 0
+
+    def close(self):
+        """Write the last rows."""
+        self.flush()
+
+    def columns(self, names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """Return all recorded values of variables `names`, or of all variables.
+
+        Parameters
+        ----------
+        names: iterable of str, optional
+            variable paths to return, all by default
+
+        Returns
+        -------
+        columns: dict[str, np.ndarray]
+            values by variable path, the first axis being the record index
+        """
+        self.flush()
+        names = self.variables if names is None else list(names)
+        if self.directory is not None:
+            return read_columns(self.directory, names)
+        return _concatenate(self._chunks, names, self._buffers)
+
+    def __enter__(self) -> "ColumnRecorder":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_columns(directory, names: Iterable[str]) -> Dict[str, np.ndarray]:
+    """Read columns `names` from the chunk files written by a `ColumnRecorder`.
+
+    Only the requested columns are read from the chunk files.
+
+    Parameters
+    ----------
+    directory: str or Path
+        directory of the chunk files
+    names: iterable of str
+        variable paths to read
+
+    Returns
+    -------
+    columns: dict[str, np.ndarray]
+        values by variable path, the first axis being the record index
+    """
+    names = list(names)
+    chunks = []
+    for path in sorted(Path(directory).glob("chunk_*.npz")):
+        with np.load(path) as data:
+            chunks.append({name: data[name] for name in names})
+
+    if not chunks:
+        return {name: np.empty(0) for name in names}
+    return _concatenate(chunks, names)
+
+
+def _concatenate(chunks, names, buffers=None) -> Dict[str, np.ndarray]:
+    if not chunks:
+        return {name: buffers[name][:0].copy() for name in names}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in names}
@@ -0,0 +1,79 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Cache of generated OCC shapes."""
+
+from functools import wraps
+from numbers import Number
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+from pyturbo.utils.lru_cache import LRUCache
+
+
+class ShapeCache(LRUCache):
+    """Bounded LRU cache of shapes, keyed by the generating function and its arguments.
+
+    Arguments may be numbers, strings, booleans, None, numerical arrays or sequences of those;
+    arrays are keyed by their bytes. Calls with other arguments, such as shapes, are not cached.
+    Cached shapes are shared, so they must not be modified in place.
+
+    Parameters
+    ----------
+    maxsize: int, default=256
+        maximum number of cached shapes, the least recently used ones are evicted first
+    """
+
+    def __init__(self, maxsize: int = 256):
+        super().__init__(maxsize)
+        self.enabled = True
+
+    @classmethod
+    def _freeze(cls, value) -> Optional[Hashable]:
+        if value is None or isinstance(value, (Number, str)):
+            return value
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind not in "biuf":
+                return None
+            return (value.dtype.str, value.shape, value.tobytes())
+        if isinstance(value, (tuple, list)):
+            items = tuple(cls._freeze(v) for v in value)
+            if any(item is None and v is not None for item, v in zip(items, value)):
+                return None
+            return items
+        return None
+
+    @classmethod
+    def key(cls, name: str, args: tuple, kwargs: dict) -> Optional[Hashable]:
+        """Return the cache key of a call, or None if it cannot be cached."""
+        values = args + tuple(kwargs.values())
+        frozen = tuple(cls._freeze(v) for v in values)
+        if any(item is None and v is not None for item, v in zip(frozen, values)):
+            return None
+        return (name, frozen[: len(args)], tuple(zip(kwargs, frozen[len(args) :])))
+
+
+shape_cache = ShapeCache()
+
+
+def cached_shape(function: Callable) -> Callable:
+    """Decorate a pure shape generating function to use `shape_cache`, if enabled."""
+    name = f"{function.__module__}.{function.__qualname__}"
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not shape_cache.enabled:
+            return function(*args, **kwargs)
+
+        key = shape_cache.key(name, args, kwargs)
+        if key is None:
+            return function(*args, **kwargs)
+
+        shape = shape_cache.get(key)
+        if shape is shape_cache._MISSING:
+            shape = function(*args, **kwargs)
+            shape_cache.set(key, shape)
+        return shape
+
+    return wrapper
@@ -0,0 +1,69 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from numbers import Number
+
+import numpy as np
+from cosapp.systems import System
+
+from pyturbo.utils.state import get_state, set_state
+
+_NAMES = "__names__"
+_VALUES = "__values__"
+_KINDS = "__kinds__"
+_TYPES = {"b": bool, "i": int, "f": float}
+
+
+def save_snapshot(system: System, file):
+    """Save the numerical input variables of `system` in a binary NumPy `.npz` file.
+
+    Input variables include inwards and solver unknowns, see `get_state`; variables which are
+    neither numbers nor numerical arrays, such as gas laws and views, are not saved. Scalars
+    are stored together as one column of values, arrays under their variable path.
+
+    Parameters
+    ----------
+    system: System
+        the system to save
+    file: str or Path or file
+        the snapshot file
+    """
+    names, values, kinds = [], [], []
+    arrays = {}
+    for name, value in get_state(system, views=False).items():
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind in "biuf":
+                arrays[name] = value
+        elif isinstance(value, Number) and not isinstance(value, complex):
+            kind = "b" if isinstance(value, (bool, np.bool_)) else np.asarray(value).dtype.kind
+            names.append(name)
+            values.append(value)
+            kinds.append("i" if kind == "u" else kind)
+
+    np.savez(
+        file,
+        **{_NAMES: np.array(names), _VALUES: np.array(values, dtype=float), _KINDS: kinds},
+        **arrays,
+    )
+    return system
+
+
+def load_snapshot(system: System, file):
+    """Set input variables of `system` from a snapshot saved by `save_snapshot`.
+
+    Parameters
+    ----------
+    system: System
+        the system to set
+    file: str or Path or file
+        the snapshot file
+    """
+    with np.load(file) as data:
+        state = {
+            str(name): _TYPES[kind](value)
+            for name, value, kind in zip(data[_NAMES], data[_VALUES].tolist(), data[_KINDS])
+        }
+        state.update((name, data[name]) for name in data.files if not name.startswith("__"))
+
+    set_state(system, state)
+    return system
@@ -0,0 +1,82 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pickle
+from typing import Any, Dict, List
+
+import numpy as np
+from cosapp.systems import System
+
+
+def get_state(system: System, views: bool = True) -> Dict[str, Any]:
+    """Return the values of all input variables of `system` and its sub-systems.
+
+    Input variables include inwards and solver unknowns, so the state is enough to reproduce a
+    solution. Keys are variable paths relative to `system`, arrays are copied. View inputs are
+    left out if `views` is False.
+    """
+    from pyturbo.ports import ViewPort
+
+    state = {}
+    for child in system.tree():
+        prefix = "" if child is system else f"{system.get_path_to_child(child)}."
+        for port in child.inputs.values():
+            if not views and isinstance(port, ViewPort):
+                continue
+            for name, value in port.items():
+                if isinstance(value, np.ndarray):
+                    value = value.copy()
+                state[f"{prefix}{port.name}.{name}"] = value
+
+    return state
+
+
+def set_state(system: System, state: Dict[str, Any]):
+    """Set input variables of `system` from a state returned by `get_state`."""
+    for name, value in state.items():
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        system[name] = value
+
+
+def dumps_state(system: System) -> bytes:
+    """Serialize the state of `system`, views excluded, see `get_state`.
+
+    The state is much smaller and faster to serialize than the system itself, so it suits
+    sending many cases to systems copied once, from a `SystemTemplate` for instance.
+    """
+    return pickle.dumps(get_state(system, views=False), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads_state(system: System, data: bytes):
+    """Set input variables of `system` from a state serialized by `dumps_state`."""
+    set_state(system, pickle.loads(data))
+
+
+def is_converged(system: System) -> bool:
+    """Return False if a driver of `system` reports a failed resolution."""
+    for driver in system.drivers.values():
+        for d in driver.tree():
+            results = getattr(d, "results", None)
+            if results is not None and not results.success:
+                return False
+    return True
+
+
+def solver_unknowns(system: System) -> List[str]:
+    """Return the paths, relative to `system`, of the unknowns solved by its drivers.
+
+    The mathematical problems of drivers are only assembled by a run, so `system` must have
+    been run before.
+    """
+    names = []
+    for driver in system.drivers.values():
+        for d in driver.tree():
+            problem = getattr(d, "problem", None)
+            if problem is None:
+                continue
+            owner = d.owner
+            prefix = "" if owner is system else f"{system.get_path_to_child(owner)}."
+            names.extend(f"{prefix}{name}" for name in problem.unknowns)
+
+    return list(dict.fromkeys(names))
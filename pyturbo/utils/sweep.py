@@ -0,0 +1,178 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from cosapp.systems import System
+
+from pyturbo.utils.state import get_state, is_converged, set_state
+
+Cases = Union[Dict[str, Iterable[float]], List[Dict[str, float]]]
+
+
+def grid(axes: Dict[str, Iterable[float]]) -> Dict[str, np.ndarray]:
+    """Return the cartesian product of `axes` as columns, the last axis varying fastest.
+
+    Parameters
+    ----------
+    axes: dict[str, iterable of float]
+        values of each variable, keyed by variable path
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        one column per variable
+    """
+    mesh = np.meshgrid(*(np.asarray(v, dtype=float) for v in axes.values()), indexing="ij")
+    return {name: m.ravel() for name, m in zip(axes, mesh)}
+
+
+def _reset(system: System, state: dict):
+    """Set the state of `system` and make its solvers compute a new Jacobian matrix."""
+    set_state(system, state)
+    for driver in system.drivers.values():
+        for d in driver.tree():
+            if hasattr(d, "compute_jacobian"):
+                d.compute_jacobian = True
+
+
+class _SweepWorker:
+    """Pre-built system running chunks of cases, each chunk starting from the initial state.
+
+    Solvers also start each chunk with a new Jacobian matrix, so results do not depend on
+    previously run chunks.
+    """
+
+    def __init__(self, factory: Callable[[], System]):
+        from pyturbo.systems.generic import set_lazy_views
+
+        self.system = factory()
+        set_lazy_views(self.system)
+        self.state = get_state(self.system)
+
+    def run(self, columns: Dict[str, np.ndarray], outputs: List[str]):
+        system = self.system
+        _reset(system, self.state)
+
+        size = len(next(iter(columns.values())))
+        values = {name: np.full(size, np.nan) for name in outputs}
+        converged = np.zeros(size, dtype=bool)
+
+        for i in range(size):
+            for name, column in columns.items():
+                system[name] = column[i]
+            try:
+                system.run_drivers()
+            except Exception:
+                _reset(system, self.state)
+                continue
+
+            converged[i] = is_converged(system)
+            for name in outputs:
+                values[name][i] = system[name]
+
+            # a failed case is a poor initial guess for the next one
+            if not converged[i]:
+                _reset(system, self.state)
+
+        return values, converged
+
+
+_worker: Optional[_SweepWorker] = None
+
+
+def _init_worker(factory: Callable[[], System]):
+    global _worker
+    _worker = _SweepWorker(factory)
+
+
+def _run_chunk(columns: Dict[str, np.ndarray], outputs: List[str]):
+    return _worker.run(columns, outputs)
+
+
+def sweep(
+    factory: Callable[[], System],
+    cases: Cases,
+    outputs: Iterable[str],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, np.ndarray]:
+    """Run `system.run_drivers()` on each case, in parallel over a process pool.
+
+    Each worker builds its own system with `factory`, drivers included, once. Cases are split
+    into contiguous chunks: a chunk starts from the initial state of the system and each case is
+    initialized with the solution of the previous one. For a given chunk size, results do not
+    depend on the number of workers nor on scheduling, up to the solver tolerance. Views are not
+    built, see `set_lazy_views`.
+
+    Parameters
+    ----------
+    factory: callable
+        picklable function returning the system to run, with its drivers, such as the `new`
+        method of a `SystemTemplate`
+    cases: dict[str, iterable of float] or list of dict[str, float]
+        input values as columns or as a list of cases, keyed by variable path
+    outputs: iterable of str
+        variable paths to collect
+    max_workers: int, optional
+        number of worker processes, defaults to the number of CPUs; 1 runs in this process
+    chunksize: int, optional
+        number of cases per chunk, defaults to a quarter of the cases per worker
+    progress: callable, optional
+        called as `progress(done, total)` each time a chunk is done
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        columns of the case inputs, of the outputs (NaN if a case raised) and a boolean
+        'converged' column, in the order of the cases
+    """
+    if not isinstance(cases, dict):
+        cases = {name: [case[name] for case in cases] for name in cases[0]} if cases else {}
+    columns = {name: np.asarray(values, dtype=float) for name, values in cases.items()}
+    if not columns:
+        raise ValueError("No cases to run.")
+
+    total = len(next(iter(columns.values())))
+    if any(len(column) != total for column in columns.values()):
+        raise ValueError("All case columns must have the same size.")
+
+    outputs = list(outputs)
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, -(-total // (4 * workers)))
+    starts = range(0, total, chunksize)
+    chunks = [
+        {name: c[start : start + chunksize] for name, c in columns.items()} for start in starts
+    ]
+
+    results = [None] * len(chunks)
+    done = 0
+
+    def collect(index: int, result: tuple):
+        nonlocal done
+        results[index] = result
+        done += len(result[1])
+        if progress is not None:
+            progress(done, total)
+
+    if workers == 1:
+        worker = _SweepWorker(factory)
+        for index, chunk in enumerate(chunks):
+            collect(index, worker.run(chunk, outputs))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(factory,)) as pool:
+            futures = {
+                pool.submit(_run_chunk, chunk, outputs): index for index, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                collect(futures[future], future.result())
+
+    data = dict(columns)
+    for name in outputs:
+        data[name] = np.concatenate([values[name] for values, _ in results])
+    data["converged"] = np.concatenate([converged for _, converged in results])
+    return data
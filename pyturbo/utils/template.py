@@ -0,0 +1,34 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pickle
+from typing import Callable
+
+from cosapp.systems import System
+
+
+class SystemTemplate:
+    """Prototype of a system, from which new systems are copied instead of being built.
+
+    The prototype is built once by `factory` and serialized, views excluded; new systems are
+    deserialized from it, so they neither run their setups nor read their data files. They
+    keep the inputs, drivers and lazy views of the prototype, and are independent from each
+    other.
+
+    Parameters
+    ----------
+    factory: Callable[[], System]
+        function building the prototype
+
+    Examples
+    --------
+    >>> template = SystemTemplate(lambda: Turbofan("tf"))
+    >>> engines = [template.new() for _ in range(10)]
+    """
+
+    def __init__(self, factory: Callable[[], System]):
+        self.data = pickle.dumps(factory(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def new(self) -> System:
+        """Return a new copy of the prototype."""
+        return pickle.loads(self.data)
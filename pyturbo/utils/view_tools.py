@@ -1,21 +1,31 @@
 # Copyright (C) 2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-"""Utility functions for visualisation."""
+"""Utility functions for visualisation.
+
+The geometry dependencies, pythonocc and pyoccad, are only imported on first use.
+"""
+
+from functools import lru_cache
 
 import numpy as np
-from pyoccad.create import (
-    CreateAxis,
-    CreateBox,
-    CreateRevolution,
-    CreateSphere,
-    CreateTopology,
-    CreateWire,
-)
-from pyoccad.transform import Rotate, Translate
 from scipy.spatial.transform import Rotation as R
 
+from pyturbo.utils.shape_cache import cached_shape
+
 
+@lru_cache(maxsize=None)
+def occ_available() -> bool:
+    """Return whether the geometry dependencies, pythonocc and pyoccad, can be imported."""
+    try:
+        import OCC.Core.gp  # noqa: F401
+        import pyoccad.create  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@cached_shape
 def create_cylinder(r: float, h: float, r_top_bottom: float = 1.0):
     """Create a cylinder from radius and height, with base in the xy plane.
 
@@ -33,6 +43,8 @@ def create_cylinder(r: float, h: float, r_top_bottom: float = 1.0):
     shape: pyoccad shape
         The pyoccad shape of the cylinder.
     """
+    from pyoccad.create import CreateAxis, CreateRevolution, CreateWire
+
     w = CreateWire.from_points(
         ([0.0, 0.0, h], [r * r_top_bottom, 0.0, h], [r, 0.0, 0], [0.0, 0.0, 0]),
         auto_close=True,
@@ -40,6 +52,7 @@ def create_cylinder(r: float, h: float, r_top_bottom: float = 1.0):
     return CreateRevolution.surface_from_curve(w, CreateAxis.oz())
 
 
+@cached_shape
 def create_cone(r: float, h: float):
     """Generate a cone from radius and height, with base in the xy plane.
 
@@ -55,6 +68,8 @@ def create_cone(r: float, h: float):
     shape: pyoccad shape
         The pyoccad shape of the cone.
     """
+    from pyoccad.create import CreateAxis, CreateRevolution, CreateWire
+
     w = CreateWire.from_points(
         ([0.0, 0.0, h], [r, 0.0, 0], [0.0, 0.0, 0]),
         auto_close=True,
@@ -62,6 +77,7 @@ def create_cone(r: float, h: float):
     return CreateRevolution.surface_from_curve(w, CreateAxis.oz())
 
 
+@cached_shape
 def create_sphere(r: float, pos):
     """Generate a sphere from radius and center position.
 
@@ -77,9 +93,12 @@ def create_sphere(r: float, pos):
     shape: pyoccad shape
         The pyoccad shape of the sphere.
     """
+    from pyoccad.create import CreateSphere
+
     return CreateSphere.solid_from_radius_and_center(r, pos)
 
 
+@cached_shape
 def create_box(dims, pos):
     """Create a box with dimensions `dims` and center `pos`.
 
@@ -95,6 +114,8 @@ def create_box(dims, pos):
     shape: pyoccad shape
         The pyoccad shape of the box.
     """
+    from pyoccad.create import CreateBox
+
     return CreateBox.from_dimensions_and_center(dims, pos)
 
 
@@ -113,6 +134,8 @@ def translate(shape, vec):
     shape: pyoccad shape
         The translated shape
     """
+    from pyoccad.transform import Translate
+
     return Translate.from_vector(shape, vec, inplace=False)
 
 
@@ -133,6 +156,8 @@ def rotate(shape, point, vec):
     shape: pyoccad shape
         The rotated shape
     """
+    from pyoccad.transform import Rotate
+
     shape = translate(shape, -point)
 
     angs = R.from_rotvec(vec).as_euler("xyz", False)
@@ -143,6 +168,7 @@ def rotate(shape, point, vec):
     return translate(shape, point)
 
 
+@cached_shape
 def create_arrow(vec, origin, scaling=1.0, size=1.0):
     """Generate an arrow shape to represent a vector.
 
@@ -162,6 +188,8 @@ def create_arrow(vec, origin, scaling=1.0, size=1.0):
     shape: pyoccad shape
         The arrow shape representing the vector.
     """
+    from pyoccad.create import CreateTopology
+
     # getting direction
     if np.linalg.norm(vec) == 0.0:
         tip_pos = tuple(np.array(origin))
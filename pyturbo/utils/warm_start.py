@@ -0,0 +1,162 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from cosapp.systems import System
+
+from pyturbo.utils.state import is_converged, solver_unknowns
+
+
+class WarmStartCache:
+    """Store of converged solver unknowns, indexed by operating point inputs.
+
+    Before a solve, unknowns are initialized from the stored solution nearest to the current
+    operating point, or interpolated between the nearest ones by inverse distance weighting.
+    Distances are computed on inputs scaled by their stored range.
+
+    Parameters
+    ----------
+    inputs: iterable of str
+        paths of the operating point inputs, e.g. ["altitude", "mach", "dtamb", "fuel_W"]
+    unknowns: iterable of str, optional
+        paths of the unknowns to store; default are the unknowns of the system drivers at the
+        first `store`
+    maxsize: int, default=1000
+        maximum number of stored solutions, the least recently used ones are evicted first
+    neighbors: int, default=1
+        number of stored solutions interpolated; 1 picks the nearest one
+
+    Examples
+    --------
+    >>> cache = WarmStartCache(["altitude", "mach", "fuel_W"])
+    >>> cache.apply(sys)
+    >>> sys.run_drivers()
+    >>> cache.store(sys)
+    """
+
+    def __init__(
+        self,
+        inputs: Iterable[str],
+        unknowns: Optional[Iterable[str]] = None,
+        maxsize: int = 1000,
+        neighbors: int = 1,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be strictly positive, got {maxsize}.")
+        if neighbors < 1:
+            raise ValueError(f"Number of neighbors must be strictly positive, got {neighbors}.")
+
+        self.inputs = list(inputs)
+        self.unknowns = None if unknowns is None else list(unknowns)
+        self.maxsize = maxsize
+        self.neighbors = neighbors
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Remove all stored solutions."""
+        self._data.clear()
+
+    def point(self, system: System) -> tuple:
+        """Return the operating point of `system`."""
+        return tuple(float(system[name]) for name in self.inputs)
+
+    def store(self, system: System) -> bool:
+        """Store the unknowns of `system` if its drivers converged.
+
+        Returns
+        -------
+        bool
+            whether the solution was stored
+        """
+        if not is_converged(system):
+            return False
+
+        if self.unknowns is None:
+            self.unknowns = solver_unknowns(system)
+
+        key = self.point(system)
+        self._data[key] = [np.array(system[name], dtype=float) for name in self.unknowns]
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+        return True
+
+    def lookup(self, point: Iterable[float]) -> Optional[Dict[str, np.ndarray]]:
+        """Return the unknowns estimated at `point`, or None if the cache is empty.
+
+        point: iterable of float
+            operating point inputs, in the order of `inputs`
+        """
+        if not self._data:
+            return None
+
+        keys = list(self._data)
+        points = np.array(keys, dtype=float).reshape(len(keys), len(self.inputs))
+        scale = np.ptp(points, axis=0)
+        scale[scale == 0.0] = 1.0
+        distance = np.linalg.norm((points - np.asarray(point, dtype=float)) / scale, axis=1)
+
+        k = min(self.neighbors, len(keys))
+        nearest = np.argsort(distance, kind="stable")[:k]
+        if distance[nearest[0]] == 0.0 or k == 1:
+            weights = np.zeros(k)
+            weights[0] = 1.0
+        else:
+            weights = 1.0 / distance[nearest]
+            weights /= weights.sum()
+
+        for i in nearest:
+            self._data.move_to_end(keys[i])
+
+        values = [self._data[keys[i]] for i in nearest]
+        return {
+            name: sum(w * v[j] for w, v in zip(weights, values))
+            for j, name in enumerate(self.unknowns)
+        }
+
+    def apply(self, system: System) -> bool:
+        """Initialize the unknowns of `system` from the cache.
+
+        Returns
+        -------
+        bool
+            whether the unknowns were initialized
+        """
+        values = self.lookup(self.point(system))
+        if values is None:
+            return False
+
+        for name, value in values.items():
+            system[name] = value if np.ndim(system[name]) else float(value)
+        return True
+
+    def save(self, file):
+        """Save the cache to a JSON file."""
+        data = {
+            "inputs": self.inputs,
+            "unknowns": self.unknowns,
+            "points": [list(key) for key in self._data],
+            "values": [[v.tolist() for v in values] for values in self._data.values()],
+        }
+        with open(file, "w") as outfile:
+            json.dump(data, outfile)
+
+    @classmethod
+    def load(cls, file, maxsize: int = 1000, neighbors: int = 1) -> "WarmStartCache":
+        """Load a cache from a JSON file written by `save`."""
+        with open(file, "r") as f:
+            data = json.load(f)
+
+        cache = cls(data["inputs"], data["unknowns"], maxsize, neighbors)
+        points: List[list] = data["points"]
+        for key, values in zip(points[-maxsize:], data["values"][-maxsize:]):
+            cache._data[tuple(key)] = [np.array(v, dtype=float) for v in values]
+        return cache
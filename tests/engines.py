@@ -0,0 +1,24 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Engines shared by the tests."""
+
+from pathlib import Path
+
+from cosapp.drivers import NonLinearSolver
+
+import pyturbo.systems.turbofan.data as tf_data
+from pyturbo.systems import TurbofanWithAtm
+from pyturbo.utils import load_from_json
+
+
+def cfm56():
+    """Return a CFM56-7 turbofan with atmosphere and a solver.
+
+    Module-level function, so that it may be pickled as a factory by `sweep`.
+    """
+    sys = TurbofanWithAtm("sys")
+    load_from_json(sys.tf, Path(tf_data.__file__).parent / "CFM56_7_geom.json")
+    load_from_json(sys.tf, Path(tf_data.__file__).parent / "CFM56_7_design_data.json")
+    sys.add_driver(NonLinearSolver("solver", tol=1e-6))
+    return sys
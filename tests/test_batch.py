@@ -0,0 +1,46 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from pyturbo.systems.mixers import MixerFluid
+from pyturbo.systems.turbofan import Turbofan
+from pyturbo.utils import run_once_batch
+
+
+class TestRunOnceBatch:
+    """Define tests for the batched run of systems."""
+
+    def test_mixer_fluid(self):
+        s = MixerFluid("aero", input_fluids=["in0", "in1"], output_fluids=["out0", "out1"])
+        s.fluid_fractions = np.r_[0.25]
+
+        res = run_once_batch(
+            s, {"in0.W": [3.0, 1.0], "in1.W": 1.0, "in0.Pt": [4000.0, 6000.0]}, ["W", "out0.W"]
+        )
+
+        assert res["W"] == pytest.approx([4.0, 2.0])
+        assert res["out0.W"] == pytest.approx([1.0, 0.5])
+        assert s.in0.W == 1.0
+
+    def test_turbofan(self):
+        fl_W = np.r_[300.0, 250.0, 200.0]
+        fuel_W = np.r_[1.0, 0.8, 0.5]
+
+        res = run_once_batch(Turbofan("tf"), {"fl_in.W": fl_W, "fuel_W": fuel_W}, ["thrust", "sfc"])
+
+        for i in range(fl_W.size):
+            tf = Turbofan("tf")
+            tf.fl_in.W = fl_W[i]
+            tf.fuel_W = fuel_W[i]
+            tf.run_once()
+
+            assert res["thrust"][i] == pytest.approx(tf.thrust, rel=1e-9)
+            assert res["sfc"][i] == pytest.approx(tf.sfc, rel=1e-9)
+
+    def test_shape(self):
+        s = MixerFluid("aero")
+
+        with pytest.raises(ValueError):
+            run_once_batch(s, {"fl_in.W": np.ones((2, 2))}, ["W"])
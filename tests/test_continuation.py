@@ -0,0 +1,38 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from pyturbo.utils import continuation
+
+from .engines import cfm56
+
+
+class TestContinuation:
+    """Define tests for the continuation along an operating line."""
+
+    def test_operating_line(self):
+        sys = cfm56()
+
+        res = continuation(sys, "fuel_W", 0.5, ["thrust"])
+
+        assert res["fuel_W"][0] == 1.0
+        assert res["fuel_W"][-1] == 0.5
+        assert np.all(np.diff(res["fuel_W"]) < 0.0)
+        assert np.all(np.diff(res["thrust"]) < 0.0)
+
+        ref = cfm56()
+        ref.fuel_W = 0.5
+        ref.run_drivers()
+
+        assert res["thrust"][-1] == pytest.approx(ref.thrust, rel=1e-4)
+        assert res["solver_calls"][1:].sum() < ref.drivers["solver"].results.fres_calls * (
+            res["fuel_W"].size - 1
+        )
+
+    def test_min_step(self):
+        sys = cfm56()
+
+        with pytest.raises(RuntimeError):
+            continuation(sys, "fuel_W", -1.0, step=1.5, min_step=1.0)
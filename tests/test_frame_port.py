@@ -0,0 +1,55 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from pyturbo.ports import Frame
+
+
+def frame():
+    return Frame(np.r_[1.0, 2.0, 3.0], np.r_[0.3, -0.2, 0.5])
+
+
+class TestFrame:
+    """Define tests for the frame transformations."""
+
+    def test_matrix(self):
+        f = frame()
+        rotation = R.from_rotvec(f.angle)
+
+        assert f.matrix[:3, :3] == pytest.approx(rotation.as_matrix())
+        assert f.apply(np.r_[1.0, 0.0, 0.0]) == pytest.approx(
+            f.position + rotation.apply([1.0, 0.0, 0.0])
+        )
+
+        f.angle = np.zeros(3)
+        assert f.matrix[:3, :3] == pytest.approx(np.eye(3))
+        assert f.position == pytest.approx([1.0, 2.0, 3.0])
+
+    def test_change_from_frame(self):
+        child, parent = Frame(np.r_[0.5, 0.0, 0.0], np.r_[0.0, 0.4, 0.0]), frame()
+        points = np.random.default_rng(0).random((5, 3))
+
+        composed = child.change_from_frame(parent)
+        assert composed.apply(points) == pytest.approx(parent.apply(child.apply(points)))
+
+        back = composed.change_to_frame(parent)
+        assert back.position == pytest.approx(child.position)
+        assert back.angle == pytest.approx(child.angle)
+
+    def test_inv(self):
+        f = frame()
+        inv = f.inv()
+
+        assert inv.angle == pytest.approx(-f.angle)
+        assert (inv.matrix @ f.matrix) == pytest.approx(np.eye(4))
+
+    def test_change_many_from_frame(self):
+        frames = [Frame(np.r_[float(i), 0.0, 0.0], np.r_[0.0, 0.0, 0.1 * i]) for i in range(4)]
+        parent = frame()
+
+        for f, expected in zip(Frame.change_many_from_frame(frames, parent), frames):
+            assert f.matrix == pytest.approx(expected.change_from_frame(parent).matrix)
+        assert Frame.change_many_from_frame([], parent) == []
@@ -1,7 +1,14 @@
 # Copyright (C) 2022-2023, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
-from pyturbo.systems.generic import GenericSimpleView
+from pyturbo.systems import Compressor
+from pyturbo.systems.generic import (
+    GenericSimpleView,
+    GenericSystemView,
+    lazy_views,
+    set_lazy_views,
+    update_views,
+)
 
 
 class TestGenericSimpleView:
@@ -13,3 +20,49 @@ class TestGenericSimpleView:
         sys.occ_view.get_value().render()
 
         assert True
+
+
+class TestGenericSystemView:
+    """Define tests for the generic system view."""
+
+    def test_names(self):
+        sys = Compressor("sys")
+        view = GenericSystemView("view", children_name=["cmp1", "cmp2"])
+        sys.run_once()
+        view.cmp1_view.set_value(sys.occ_view.get_value())
+        view.cmp2_view.set_value(sys.occ_view.get_value())
+        view.run_once()
+
+        assert list(view.occ_view.shapes) == ["cmp1.shell", "cmp2.shell"]
+
+
+class TestLazyViews:
+    """Define tests for the views built on demand."""
+
+    def test_set_lazy_views(self):
+        sys = Compressor("sys")
+        set_lazy_views(sys)
+        sys.run_once()
+
+        assert sys.view.lazy
+        assert sys.occ_view.shapes == {}
+
+        update_views(sys)
+        assert list(sys.occ_view.shapes) == ["shell"]
+
+        set_lazy_views(sys, False)
+        sys.view.occ_view.null()
+        sys.kp.exit_tip = sys.kp.exit_tip * 1.1
+        sys.run_once()
+        assert list(sys.view.occ_view.shapes) == ["shell"]
+
+    def test_lazy_views(self):
+        sys = Compressor("sys")
+
+        with lazy_views(sys):
+            assert sys.view.lazy
+            sys.run_once()
+            assert sys.occ_view.shapes == {}
+
+        assert not sys.view.lazy
+        assert list(sys.occ_view.shapes) == ["shell"]
@@ -1,10 +1,34 @@
 # Copyright (C) 2022-2023, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+import pickle
+
 import numpy as np
 import pytest
 
-from pyturbo.thermo import IdealDryAir, IdealGas
+from pyturbo.thermo import IdealDryAir, IdealGas, clear_gas_registry, shared_gas
+
+
+class LinearCpGas(IdealGas):
+    """Ideal gas with a heat capacity linear in temperature."""
+
+    def __init__(self):
+        super().__init__(287.058, 1004.0)
+
+    def cp(self, t):
+        return 950.0 + 0.2 * t
+
+    def gamma(self, t):
+        return self.cp(t) / (self.cp(t) - self.r)
+
+    def h(self, t):
+        return 950.0 * t + 0.1 * t**2
+
+    def phi(self, t):
+        return 950.0 * np.log(t) + 0.2 * t
+
+    def pr(self, t1, t2, eff_poly):
+        return np.exp((self.phi(t2) - self.phi(t1)) * eff_poly / self.r)
 
 
 class TestIdealGas:
@@ -97,6 +121,165 @@ class TestIdealGas:
 
         assert mach == pytest.approx(self.gas.mach_f_wqa(pt, tt, rhoV, 1e-6, False), 1e-3)
 
+    def test_mach_f_wqa_choked(self):
+        pt = 1e5
+        tt = 300.0
+        wqa = 2.0 * self.gas.wqa_crit(pt, tt, 1e-6)
+
+        assert self.gas.mach_f_wqa(pt, tt, wqa, 1e-6) == 1.0
+
+    @pytest.mark.parametrize("subsonic, mach", [(True, 0.3), (True, 0.97), (False, 2.0)])
+    def test_mach_f_wqa_table(self, subsonic, mach):
+        ts = 300.0
+        ps = 1e5
+
+        tt = self.gas.total_t(ts, mach)
+        pt = self.gas.total_p(ps, ts, tt)
+        rhoV = self.gas.density(ps, ts) * mach * self.gas.c(ts)
+
+        expected = self.gas._mach_f_wqa_bracket(
+            np.r_[pt], np.r_[tt], np.r_[rhoV], 1e-6, subsonic
+        ).item()
+        assert self.gas.mach_f_wqa(pt, tt, rhoV, 1e-6, subsonic) == pytest.approx(expected, 1e-10)
+
+    @pytest.mark.parametrize("tt, mach", [(300.0, 0.3), (900.0, 0.5), (1500.0, 0.8)])
+    def test_mach_f_wqa_variable_gamma(self, monkeypatch, tt, mach):
+        """The table and secant steps converge without the bracketed search."""
+        gas = LinearCpGas()
+        pt = 2e5
+        ts = gas.static_t(tt, mach, 1e-12)
+        rhoV = gas.density(pt * gas.pr(tt, ts, 1.0), ts) * mach * gas.c(ts)
+
+        def bracket(*args):
+            raise AssertionError("bracketed search")
+
+        monkeypatch.setattr(gas, "_mach_f_wqa_bracket", bracket)
+        assert gas.mach_f_wqa(pt, tt, rhoV, 1e-6) == pytest.approx(mach, abs=1e-6)
+
+    def test_mach_f_ptpstt(self):
+        mach = 0.5
+        ts = 300.0
+        ps = 1e5
+
+        tt = self.gas.total_t(ts, mach)
+        pt = self.gas.total_p(ps, ts, tt)
+
+        assert mach == pytest.approx(self.gas.mach_f_ptpstt(pt, ps, tt, 1e-6), 1e-3)
+
+    @pytest.mark.parametrize("mach", [0.0, 0.05, 0.7, 1.0, 2.5])
+    def test_mach_f_ptpstt_newton(self, mach):
+        ts = 300.0
+        ps = 1e5
+
+        tt = self.gas.total_t(ts, mach)
+        pt = self.gas.total_p(ps, ts, tt)
+
+        expected = self.gas._mach_f_ptpstt_bracket(np.r_[pt], np.r_[ps], np.r_[tt], 1e-6).item()
+        assert self.gas.mach_f_ptpstt(pt, ps, tt, 1e-6) == pytest.approx(expected, abs=1e-10)
+        assert self.gas.mach_f_ptpstt(pt, ps, tt, 1e-6) == pytest.approx(mach, abs=1e-10)
+
+    def test_mach_f_ptpstt_no_expansion(self):
+        assert self.gas.mach_f_ptpstt(1e5, 1.1e5, 300.0, 1e-6) == 0.0
+
+    def test_vectorized(self):
+        mach = np.linspace(0.1, 0.9, 12).reshape(3, 4)
+        ts = 300.0
+        ps = 1e5
+
+        tt = self.gas.total_t(ts, mach)
+        pt = self.gas.total_p(ps, ts, tt)
+        rhoV = self.gas.density(ps, ts) * mach * self.gas.c(ts)
+
+        assert self.gas.static_t(tt, mach).shape == mach.shape
+        assert self.gas.static_p(pt, tt, mach, 1e-6) == pytest.approx(np.full_like(mach, ps))
+        assert self.gas.wqa_crit(pt, tt, 1e-6).shape == mach.shape
+        assert self.gas.mach_f_wqa(pt, tt, rhoV, 1e-6) == pytest.approx(mach, 1e-6)
+        assert self.gas.mach_f_ptpstt(pt, ps, tt, 1e-6) == pytest.approx(mach, 1e-6)
+
+        for i, m in enumerate(mach.flat):
+            assert self.gas.mach_f_wqa(pt.flat[i], tt.flat[i], rhoV.flat[i], 1e-6) == (
+                pytest.approx(m, 1e-6)
+            )
+
+
+class TestTabulatedGas:
+    """Define tests for the tabulated mode of the ideal gas model."""
+
+    gas = IdealGas(287.058, 1004.0).tabulate(200.0, 2000.0)
+    exact = IdealGas(287.058, 1004.0)
+
+    def test_table_error(self):
+        assert self.gas.table_error["h"] < 1e-6
+        assert self.gas.table_error["phi"] < 1e-6
+        assert self.gas.table_error["t"] < 1e-6
+
+    @pytest.mark.parametrize("t", [250.0, 1234.5, np.r_[300.0, 1800.0]])
+    def test_h(self, t):
+        assert self.gas.h(t) == pytest.approx(self.exact.h(t), rel=1e-10)
+        assert self.gas.t_f_h(self.exact.h(t)) == pytest.approx(t, rel=1e-10)
+
+    @pytest.mark.parametrize("t", [250.0, 1234.5, np.r_[300.0, 1800.0]])
+    def test_phi(self, t):
+        assert self.gas.phi(t) == pytest.approx(self.exact.phi(t), rel=1e-10)
+        assert self.gas.t_f_phi(self.exact.phi(t)) == pytest.approx(t, rel=1e-10)
+        assert self.exact.t_f_phi(self.exact.phi(t)) == pytest.approx(t, rel=1e-6)
+
+    def test_out_of_range(self):
+        assert self.gas.h(100.0) == pytest.approx(self.exact.h(100.0), rel=1e-10)
+        assert self.gas.t_f_h(self.exact.h(3000.0)) == pytest.approx(3000.0, rel=1e-6)
+
+    def test_switch(self):
+        gas = IdealGas(287.058, 1004.0).tabulate()
+        assert gas.tabulated
+
+        gas.tabulated = False
+        assert gas.t_f_h(gas.h(500.0)) == pytest.approx(500.0, rel=1e-6)
+
+
+class TestGasCache:
+    """Define tests for the memoization of gas properties."""
+
+    def test_disabled(self):
+        gas = IdealGas(287.058, 1004.0)
+        assert gas.cache_info() is None
+
+    def test_hits(self):
+        gas = IdealGas(287.058, 1004.0).enable_cache(maxsize=16)
+
+        value = gas.wqa_crit(1e5, 300.0, 1e-6)
+        misses = gas.cache_info().misses
+        assert gas.cache_info().hits == 0
+
+        assert gas.wqa_crit(1e5, 300.0, 1e-6) == value
+        assert gas.cache_info().hits == 1
+        assert gas.cache_info().misses == misses
+
+        gas.cache_clear()
+        assert gas.cache_info() == (0, 0, 16, 0)
+
+    def test_arrays_bypass(self):
+        gas = IdealGas(287.058, 1004.0).enable_cache()
+
+        gas.static_t(np.r_[300.0, 400.0], 0.5)
+        assert gas.cache_info().currsize == 0
+
+    def test_eviction(self):
+        gas = IdealGas(287.058, 1004.0).enable_cache(maxsize=2)
+
+        for t in (300.0, 400.0, 500.0):
+            gas.h(t)
+
+        assert gas.cache_info().currsize == 2
+        gas.h(300.0)
+        assert gas.cache_info().hits == 0
+
+    def test_tabulated_switch(self):
+        gas = IdealGas(287.058, 1004.0).enable_cache()
+        gas.h(300.0)
+
+        gas.tabulate()
+        assert gas.cache_info().currsize == 0
+
 
 class TestDryAir:
     """Define tests for the dry air gas."""
@@ -112,3 +295,52 @@ class TestDryAir:
 
     def test_r(self):
         assert self.gas.r == self.air.r
+
+
+class TestSharedGas:
+    """Define tests for the shared gas instances."""
+
+    def test_same_law(self):
+        assert shared_gas() is shared_gas(IdealDryAir)
+        assert shared_gas(IdealGas, 287.058, 1004.0) is shared_gas(IdealGas, 287.058, 1004.0)
+        assert shared_gas(IdealGas, 287.058, 1004.0) is not shared_gas(IdealGas, 287.058, 1100.0)
+
+    def test_frozen(self):
+        gas = shared_gas(IdealGas, 287.058, 1004.0)
+
+        with pytest.raises(AttributeError):
+            gas.some_attribute = 1.0
+
+    def test_shared_acceleration(self):
+        shared_gas(IdealGas, 290.0, 1000.0).tabulate().enable_cache()
+
+        assert shared_gas(IdealGas, 290.0, 1000.0).tabulated
+        assert shared_gas(IdealGas, 290.0, 1000.0).cache_info() is not None
+
+    def test_pickle(self):
+        gas = IdealGas(287.058, 1004.0)
+
+        assert pickle.loads(pickle.dumps(shared_gas())) is shared_gas()
+        assert pickle.loads(pickle.dumps(gas)) is not gas
+        assert pickle.loads(pickle.dumps(gas)).cp(300.0) == gas.cp(300.0)
+
+    def test_pickle_acceleration(self):
+        gas = shared_gas(IdealGas, 295.0, 1010.0).tabulate(200.0, 2000.0, 64).enable_cache(128)
+        data = pickle.dumps(gas)
+
+        # a new process starts with an empty registry
+        clear_gas_registry()
+        loaded = pickle.loads(data)
+        assert loaded is shared_gas(IdealGas, 295.0, 1010.0)
+        assert loaded is not gas
+        assert loaded.tabulated
+        assert loaded.table_error == gas.table_error
+        assert loaded.cache_info().maxsize == 128
+        assert loaded.h(500.0) == gas.h(500.0)
+
+        # an existing shared instance is left untouched
+        gas.tabulated = False
+        gas.disable_cache()
+        assert pickle.loads(pickle.dumps(gas)) is loaded
+        assert loaded.tabulated
+        assert loaded.cache_info().maxsize == 128
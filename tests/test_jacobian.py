@@ -0,0 +1,276 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from cosapp.core.numerics.solve import FfdJacobianEvaluation, SparseLUSolver
+from cosapp.drivers import NonLinearSolver
+
+import pyturbo.systems.turbine.data as trb_data
+from pyturbo.systems import Combustor, Turbine
+from pyturbo.systems.compressor import CompressorAero
+from pyturbo.systems.mixers import MixerFluid, MixerShaft
+from pyturbo.utils import (
+    AdaptiveJacobian,
+    ChainRuleJacobian,
+    ColoredJacobian,
+    color_columns,
+    grid,
+    jacobian_sparsity,
+)
+
+from .engines import cfm56
+
+
+def compressor():
+    sys = CompressorAero("cmp")
+    sys.tip_in_r = 0.8
+    sys.tip_out_r = 0.8
+    sys.inlet_area = np.pi * sys.tip_in_r**2 * (1 - 0.3**2)
+    sys.eff_poly = 0.85
+    sys.sh_in.N = 5500.0
+    sys.sh_in.power = 17e6
+    sys.fl_in.W = 308.3
+    return sys
+
+
+def turbine():
+    sys = Turbine("tur", init_file=Path(trb_data.__file__).parent / "hpt.json")
+    sys.run_once()
+    return sys.aero
+
+
+def combustor():
+    sys = Combustor("comb")
+    sys.fl_in.W = 100.0
+    sys.run_once()
+    return sys.aero
+
+
+def mixer_fluid():
+    sys = MixerFluid("aero", input_fluids=["in0", "in1"], output_fluids=["out0", "out1"])
+    sys.in0.Pt, sys.in1.Pt = 4000.0, 6000.0
+    sys.in0.W, sys.in1.W = 3.0, 1.0
+    sys.in0.Tt, sys.in1.Tt = 300.0, 400.0
+    sys.fluid_fractions = np.r_[0.25]
+    return sys
+
+
+def mixer_shaft():
+    sys = MixerShaft("shaft", input_shafts=["in0", "in1"], output_shafts=["out0", "out1"])
+    sys.in0.N, sys.in1.N = 4000.0, 6000.0
+    sys.in0.power, sys.in1.power = 1e6, 3e6
+    sys.power_fractions = np.r_[0.75]
+    return sys
+
+
+class TestPartials:
+    """Define tests for the analytical partial derivatives of the aero models."""
+
+    @pytest.mark.parametrize("factory", [compressor, turbine, combustor, mixer_fluid, mixer_shaft])
+    def test_finite_differences(self, factory):
+        sys = factory()
+        sys.run_once()
+        partials = sys.partials()
+
+        def outputs():
+            return {
+                name if port.name == "outwards" else f"{port.name}.{name}": np.array(
+                    value, dtype=float
+                )
+                for port in sys.outputs.values()
+                for name, value in port.items()
+                if isinstance(value, (float, np.ndarray))
+            }
+
+        assert partials
+        for wrt, derivatives in partials.items():
+            value = np.array(sys[wrt], dtype=float)
+            for i in range(value.size):
+                h = 1e-6 * max(abs(value.flat[i]), 1e-3)
+                x = value.copy()
+                x.flat[i] += h
+                sys[wrt] = x if value.ndim else float(x)
+                sys.compute()
+                plus = outputs()
+                x.flat[i] -= 2.0 * h
+                sys[wrt] = x if value.ndim else float(x)
+                sys.compute()
+                minus = outputs()
+                sys[wrt] = value if value.ndim else float(value)
+                sys.compute()
+
+                for of in plus:
+                    fd = (plus[of] - minus[of]) / (2.0 * h)
+                    d = np.reshape(derivatives.get(of, 0.0), (fd.size, value.size))[:, i]
+                    scale = max(np.max(np.abs(fd)), np.max(np.abs(d)), 1e-6)
+                    assert d == pytest.approx(fd.ravel(), abs=1e-4 * scale), f"d{of}/d{wrt}"
+
+
+class TestChainRuleJacobian:
+    """Define tests for the chain rule Jacobian."""
+
+    class Compare(ChainRuleJacobian):
+        """Store the finite difference Jacobian along with the chain rule one."""
+
+        def _sequential_evaluation(self, jac, x0, r0, x_indices_to_update):
+            indices = list(x_indices_to_update)
+            super()._sequential_evaluation(jac, x0, r0, indices)
+            self.reference = jac.copy()
+            FfdJacobianEvaluation._sequential_evaluation(self, self.reference, x0, r0, indices)
+            self.jac = jac.copy()
+
+    def test_finite_differences(self):
+        sys = cfm56()
+        jac = self.Compare()
+        sys.drivers.clear()
+        sys.add_driver(NonLinearSolver("solver", tol=1e-6, jac=jac))
+        sys.run_drivers()
+
+        scale = np.max(np.abs(jac.reference), axis=1, keepdims=True)
+        assert np.all(np.abs(jac.jac - jac.reference) <= 1e-3 * scale)
+
+    def test_solve(self):
+        sys = cfm56()
+        sys.run_drivers()
+        thrust = sys.tf.thrust
+        calls = sys.drivers["solver"].results.fres_calls
+
+        sys = cfm56()
+        sys.drivers.clear()
+        solver = sys.add_driver(NonLinearSolver("solver", tol=1e-6, jac=ChainRuleJacobian()))
+        sys.run_drivers()
+
+        assert solver.results.success
+        assert solver.results.fres_calls == calls
+        assert sys.tf.thrust == pytest.approx(thrust, rel=1e-6)
+
+    class Count(ChainRuleJacobian):
+        """Count the model evaluations of the Jacobian builds."""
+
+        builds = evaluations = 0
+
+        def _fresidues(self, x):
+            self.evaluations += 1
+            return super()._fresidues(x)
+
+        def _sequential_evaluation(self, jac, x0, r0, x_indices_to_update):
+            self.builds += 1
+            super()._sequential_evaluation(jac, x0, r0, x_indices_to_update)
+
+    def test_evaluations(self):
+        """A Jacobian costs one model evaluation, instead of one per unknown."""
+        sys = cfm56()
+        jac = self.Count()
+        sys.drivers.clear()
+        solver = sys.add_driver(NonLinearSolver("solver", tol=1e-6, jac=jac))
+        sys.run_drivers()
+
+        assert solver.results.success
+        assert jac.builds > 0
+        assert jac.evaluations == jac.builds
+        assert len(solver.problem.unknowns) >= 10
+
+    def test_cosapp_internals(self, monkeypatch):
+        monkeypatch.delattr(FfdJacobianEvaluation, "_sequential_evaluation")
+
+        with pytest.raises(AttributeError, match="_sequential_evaluation"):
+            ChainRuleJacobian()
+        with pytest.raises(AttributeError, match="_sequential_evaluation"):
+            ColoredJacobian()
+
+
+class TestSparsity:
+    """Define tests for the Jacobian structure and the grouped finite differences."""
+
+    class Check(FfdJacobianEvaluation):
+        """Store the finite difference Jacobian and its expected structure."""
+
+        def _sequential_evaluation(self, jac, x0, r0, x_indices_to_update):
+            super()._sequential_evaluation(jac, x0, r0, x_indices_to_update)
+            self.jac = jac.copy()
+            self.structure = jacobian_sparsity(self._fun.__self__.problem).toarray()
+
+    def test_jacobian_sparsity(self):
+        sys = cfm56()
+        jac = self.Check()
+        sys.drivers.clear()
+        sys.add_driver(NonLinearSolver("solver", tol=1e-6, jac=jac))
+        sys.run_drivers()
+
+        assert jac.structure.shape == jac.jac.shape
+        assert not np.any((jac.jac != 0.0) & ~jac.structure)
+        assert not jac.structure.all()
+
+    def test_color_columns(self):
+        structure = sp.csr_matrix(
+            np.array(
+                [
+                    [1, 0, 0, 1],
+                    [0, 1, 0, 1],
+                    [0, 0, 1, 0],
+                ],
+                dtype=bool,
+            )
+        )
+        groups = color_columns(structure)
+
+        assert groups == {0: [3, 2], 1: [0, 1]}
+        for columns in groups.values():
+            assert structure[:, columns].sum(axis=1).max() <= 1
+
+    def test_solve(self):
+        sys = cfm56()
+        sys.run_drivers()
+        thrust = sys.tf.thrust
+
+        sys = cfm56()
+        sys.drivers.clear()
+        jac = ColoredJacobian()
+        solver = sys.add_driver(
+            NonLinearSolver("solver", tol=1e-6, jac=jac, linear_solver=SparseLUSolver())
+        )
+        sys.run_drivers()
+
+        assert solver.results.success
+        assert sys.tf.thrust == pytest.approx(thrust, rel=1e-6)
+        assert len(jac.sparsity[1]) < len(solver.problem.unknowns)
+
+
+class TestAdaptiveJacobian:
+    """Define tests for the Jacobian reuse across solver runs."""
+
+    cases = grid({"altitude": [0.0, 3000.0], "fuel_W": [0.7, 0.9]})
+
+    def run(self, sys):
+        thrust = []
+        for altitude, fuel_W in zip(self.cases["altitude"], self.cases["fuel_W"]):
+            sys.altitude = altitude
+            sys.fuel_W = fuel_W
+            sys.run_drivers()
+            assert sys.drivers["solver"].results.success
+            thrust.append(sys.tf.thrust)
+        return thrust
+
+    def test_rate(self):
+        with pytest.raises(ValueError):
+            AdaptiveJacobian(rate=1.0)
+
+    def test_sweep(self):
+        thrust = self.run(cfm56())
+
+        sys = cfm56()
+        sys.drivers.clear()
+        jac = AdaptiveJacobian(ColoredJacobian())
+        sys.add_driver(NonLinearSolver("solver", tol=1e-6, jac=jac))
+
+        assert self.run(sys) == pytest.approx(thrust, rel=1e-6)
+        assert jac.stats.broyden_updates > jac.jac.get_stats().broyden_updates
+        assert jac.stats.full_updates > 0
+        assert jac.sparsity is not None
+
+        jac.reset_stats()
+        assert jac.stats == (0, 0, 0)
@@ -0,0 +1,74 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+from cosapp.systems import System
+
+from pyturbo.utils import ColumnRecorder, read_columns
+
+
+class Linear(System):
+    def setup(self):
+        self.add_inward("x", 0.0)
+        self.add_inward("v", np.zeros(2))
+        self.add_outward("y", 0.0)
+
+    def compute(self):
+        self.y = 2.0 * self.x
+
+
+class TestColumnRecorder:
+    """Define tests for the columnar recorder."""
+
+    def run(self, recorder, sys, size):
+        for i in range(size):
+            sys.x = float(i)
+            sys.v = np.r_[i, -i]
+            sys.run_once()
+            recorder.record()
+
+    def test_chunk_size(self):
+        with pytest.raises(ValueError):
+            ColumnRecorder(Linear("s"), ["x"], chunk_size=0)
+
+    def test_memory(self):
+        sys = Linear("s")
+        recorder = ColumnRecorder(sys, ["x", "y", "v"], chunk_size=3)
+        self.run(recorder, sys, 7)
+
+        columns = recorder.columns()
+        assert recorder.size == 7
+        assert columns["y"] == pytest.approx(2.0 * np.arange(7))
+        assert columns["v"].shape == (7, 2)
+        assert recorder.columns(["x"]).keys() == {"x"}
+
+    def test_directory(self, tmp_path):
+        sys = Linear("s")
+        with ColumnRecorder(sys, ["x", "y", "v"], tmp_path / "results", chunk_size=3) as recorder:
+            self.run(recorder, sys, 7)
+            assert len(list((tmp_path / "results").glob("chunk_*.npz"))) == 2
+
+        assert len(list((tmp_path / "results").glob("chunk_*.npz"))) == 3
+        columns = read_columns(tmp_path / "results", ["y", "v"])
+        assert columns["y"] == pytest.approx(2.0 * np.arange(7))
+        assert columns["v"][:, 1] == pytest.approx(-np.arange(7))
+
+    def test_directory_reuse(self, tmp_path):
+        sys = Linear("s")
+        with ColumnRecorder(sys, ["x"], tmp_path, chunk_size=3) as recorder:
+            self.run(recorder, sys, 5)
+
+        with pytest.raises(FileExistsError):
+            ColumnRecorder(sys, ["x"], tmp_path)
+        assert read_columns(tmp_path, ["x"])["x"] == pytest.approx(np.arange(5))
+
+    def test_int_variable(self):
+        sys = Linear("s")
+        sys.x = 0
+        recorder = ColumnRecorder(sys, ["x"])
+        for x in (0.5, 1.5, 2.7):
+            sys.x = x
+            recorder.record()
+
+        assert recorder.columns()["x"] == pytest.approx([0.5, 1.5, 2.7])
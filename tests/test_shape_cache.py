@@ -0,0 +1,66 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import subprocess
+from sys import executable
+
+import numpy as np
+import pytest
+
+from pyturbo.systems.generic import GenericSimpleView
+from pyturbo.utils import ShapeCache, create_cylinder, shape_cache
+
+
+@pytest.fixture
+def cache():
+    shape_cache.clear()
+    yield shape_cache
+    shape_cache.enabled = True
+    shape_cache.clear()
+
+
+class TestShapeCache:
+    """Define tests for the cache of generated shapes."""
+
+    def test_key(self):
+        a = ShapeCache.key("f", (np.r_[0.0, 1.0], 2.0), {"shell": True})
+
+        assert a == ShapeCache.key("f", (np.r_[0.0, 1.0], 2.0), {"shell": True})
+        assert a != ShapeCache.key("f", (np.r_[0.0, 1.5], 2.0), {"shell": True})
+        assert a != ShapeCache.key("f", (np.r_[0.0, 1.0], 2.0), {"shell": False})
+        assert ShapeCache.key("f", ([0.0, 1.0], (0, 0, 1)), {}) is not None
+        assert ShapeCache.key("f", (object(),), {}) is None
+
+    def test_keypoints_view(self, cache):
+        port = GenericSimpleView("sys").kp
+
+        shape = port.view()
+        assert cache.info().misses == 1
+        assert port.view() is shape
+        assert cache.info().hits == 1
+        assert port.view(shell=True) is not shape
+
+        port.exit_tip = port.exit_tip * 1.1
+        assert port.view() is not shape
+        assert cache.info().currsize == 3
+
+    def test_disabled(self, cache):
+        cache.enabled = False
+        create_cylinder(1.0, 2.0)
+
+        assert cache.info() == (0, 0, cache.maxsize, 0)
+
+    def test_eviction(self):
+        cache = ShapeCache(maxsize=2)
+        for i in range(3):
+            cache.set(cache.key("f", (float(i),), {}), i)
+
+        assert cache.info().currsize == 2
+        assert cache.get(cache.key("f", (0.0,), {})) is cache._MISSING
+
+    def test_light_import(self):
+        """Geometry does not depend on thermodynamics."""
+        script = (
+            "import sys\n" "import pyturbo.ports\n" "assert 'pyturbo.thermo' not in sys.modules\n"
+        )
+        subprocess.run([executable, "-c", script], check=True)
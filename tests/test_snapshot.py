@@ -0,0 +1,45 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from pyturbo.utils import load_from_json, load_snapshot, save_snapshot, save_to_json
+
+from .engines import cfm56
+
+
+class TestSnapshot:
+    """Define tests for the binary snapshots of system inputs."""
+
+    def test_round_trip(self, tmp_path):
+        sys = cfm56()
+        sys.fuel_W = 0.9
+        sys.altitude = 0
+        sys.run_drivers()
+        save_snapshot(sys, tmp_path / "state.npz")
+
+        other = load_snapshot(cfm56(), tmp_path / "state.npz")
+        assert other.fuel_W == 0.9
+        assert isinstance(other.altitude, int)
+        assert other.tf.fan_module.splitter_fluid.fluid_fractions == pytest.approx(
+            sys.tf.fan_module.splitter_fluid.fluid_fractions
+        )
+
+        other.run_drivers()
+        assert other.drivers["solver"].results.success
+        assert other.tf.thrust == pytest.approx(sys.tf.thrust, rel=1e-9)
+
+
+class TestJson:
+    """Define tests for the JSON files of system inputs."""
+
+    def test_arrays(self, tmp_path):
+        sys = cfm56()
+        sys.tf.fan_module.splitter_fluid.fluid_fractions = np.r_[0.5]
+
+        with pytest.warns(UserWarning, match="tf.fan_module.fan.aero.gas"):
+            save_to_json(sys, tmp_path / "state.json")
+
+        other = load_from_json(cfm56(), tmp_path / "state.json")
+        assert other.tf.fan_module.splitter_fluid.fluid_fractions == pytest.approx([0.5])
@@ -0,0 +1,50 @@
+# Copyright (C) 2025, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import ambiance
+import numpy as np
+import pytest
+
+from pyturbo.thermo import StandardAtmosphere, standard_atmosphere
+
+
+class TestStandardAtmosphere:
+    """Define tests for the tabulated standard atmosphere."""
+
+    isa = StandardAtmosphere()
+
+    def test_sea_level(self):
+        pamb, tamb = self.isa.state(0.0)
+
+        assert pamb == 101325.0
+        assert tamb == 288.15
+
+    def test_memo(self):
+        isa = StandardAtmosphere()
+
+        isa.state(1000.0)
+        isa.state(1000.0)
+
+        assert isa.cache_info().hits == 1
+        assert isa.cache_info().misses == 1
+
+    def test_vectorized(self):
+        altitude = np.linspace(-5000.0, 81000.0, 5001)
+        pamb, tamb = self.isa.state(altitude)
+        atm = ambiance.Atmosphere(altitude)
+
+        assert pamb == pytest.approx(atm.pressure, rel=1e-9)
+        assert tamb == pytest.approx(atm.temperature, rel=1e-12)
+
+    def test_shape(self):
+        altitude = np.full((2, 3), 15000.0)
+
+        assert self.isa.pressure(altitude).shape == (2, 3)
+        assert self.isa.temperature(altitude) == pytest.approx(np.full((2, 3), 216.65))
+
+    def test_out_of_bounds(self):
+        with pytest.raises(ValueError):
+            self.isa.state(np.r_[0.0, 1e5])
+
+    def test_shared(self):
+        assert standard_atmosphere() is standard_atmosphere()
@@ -0,0 +1,68 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from pyturbo.utils import get_state, grid, set_state, sweep
+
+from .engines import cfm56
+
+
+class TestSweep:
+    """Define tests for the operating point sweep."""
+
+    cases = grid({"altitude": [0.0, 5000.0], "fuel_W": [0.8, 1.0]})
+
+    def test_grid(self):
+        cases = self.cases
+
+        assert cases["altitude"].tolist() == [0.0, 0.0, 5000.0, 5000.0]
+        assert cases["fuel_W"].tolist() == [0.8, 1.0, 0.8, 1.0]
+
+    def test_state(self):
+        sys = cfm56()
+        state = get_state(sys)
+        sys.fuel_W = 2.0
+        sys.tf.fan_module.splitter_fluid.fluid_fractions[0] = 0.5
+
+        set_state(sys, state)
+
+        assert sys.fuel_W == state["inwards.fuel_W"]
+        assert sys.tf.fan_module.splitter_fluid.fluid_fractions[0] == pytest.approx(
+            state["tf.fan_module.splitter_fluid.inwards.fluid_fractions"][0]
+        )
+
+    def test_serial(self):
+        progress = []
+        res = sweep(
+            cfm56,
+            self.cases,
+            ["thrust", "tf.sfc"],
+            max_workers=1,
+            chunksize=2,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert progress == [(2, 4), (4, 4)]
+        assert np.all(res["converged"])
+        assert res["altitude"].tolist() == self.cases["altitude"].tolist()
+
+        sys = cfm56()
+        sys.altitude = 5000.0
+        sys.fuel_W = 0.8
+        sys.run_drivers()
+        assert res["thrust"][2] == pytest.approx(sys.thrust, rel=1e-4)
+
+    def test_parallel(self):
+        cases = [{"altitude": 0.0, "fuel_W": 0.8}, {"altitude": 5000.0, "fuel_W": 1.0}]
+
+        serial = sweep(cfm56, cases, ["thrust"], max_workers=1, chunksize=1)
+        parallel = sweep(cfm56, cases, ["thrust"], max_workers=2, chunksize=1)
+
+        assert parallel["thrust"] == pytest.approx(serial["thrust"], rel=1e-9)
+        assert np.array_equal(parallel["converged"], serial["converged"])
+
+    def test_bad_cases(self):
+        with pytest.raises(ValueError):
+            sweep(cfm56, {"altitude": [0.0], "fuel_W": [1.0, 2.0]}, ["thrust"])
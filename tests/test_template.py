@@ -0,0 +1,87 @@
+# Copyright (C) 2024, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pickle
+
+import pytest
+
+from pyturbo.systems.generic import set_lazy_views, update_views
+from pyturbo.thermo import shared_gas
+from pyturbo.utils import SystemTemplate, dumps_state, loads_state
+
+from .engines import cfm56
+
+
+def lazy_cfm56():
+    sys = cfm56()
+    set_lazy_views(sys)
+    sys.run_once()
+    return sys
+
+
+class TestSystemTemplate:
+    """Define tests for the systems copied from a prototype."""
+
+    def test_new(self):
+        template = SystemTemplate(lazy_cfm56)
+        sys, other = template.new(), template.new()
+
+        assert sys is not other
+        assert sys.tf.fan_module.fan.view.lazy
+        assert sys.tf.occ_view.shapes == {}
+
+        sys.fuel_W = 0.9
+        assert other.fuel_W != 0.9
+
+        ref = cfm56()
+        ref.run_drivers()
+        other.run_drivers()
+        assert other.drivers["solver"].results.success
+        assert other.tf.thrust == pytest.approx(ref.tf.thrust, rel=1e-9)
+
+    def test_new_keeps_shared_gas(self):
+        template = SystemTemplate(lazy_cfm56)
+        sys = cfm56()
+        gas = sys.tf.fan_module.fan.aero.gas
+        assert gas is shared_gas()
+        tabulated, info = gas.tabulated, gas.cache_info()
+
+        gas.tabulate().enable_cache(8192)
+        try:
+            assert template.new().tf.fan_module.fan.aero.gas is gas
+            assert gas.tabulated
+            assert gas.cache_info().maxsize == 8192
+        finally:
+            gas.tabulated = tabulated
+            if info is None:
+                gas.disable_cache()
+            else:
+                gas.enable_cache(info.maxsize)
+
+
+class TestSerialization:
+    """Define tests for the serialization of systems and of their states."""
+
+    def test_pickle(self):
+        sys = lazy_cfm56()
+        sys.drivers["solver"].options["max_iter"] = 42
+        update_views(sys)
+        assert sys.tf.occ_view.shapes
+
+        copy = pickle.loads(pickle.dumps(sys))
+        assert copy.tf.occ_view.shapes == {}
+        assert copy.tf.fan_module.fan.view.lazy
+        assert copy.tf.fan_module.fan.aero.gas is sys.tf.fan_module.fan.aero.gas
+        assert copy.drivers["solver"].options["max_iter"] == 42
+
+    def test_state(self):
+        sys = cfm56()
+        sys.fuel_W = 0.9
+        sys.run_drivers()
+
+        copy = cfm56()
+        loads_state(copy, dumps_state(sys))
+        copy.run_drivers()
+
+        assert copy.drivers["solver"].results.success
+        assert copy.tf.thrust == pytest.approx(sys.tf.thrust, rel=1e-9)
@@ -1,7 +1,9 @@
 # Copyright (C) 2022-2023, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+import subprocess
 from pathlib import Path
+from sys import executable
 
 import numpy as np
 import pytest
@@ -89,6 +91,18 @@ class TestTurbofan:
 
         assert True
 
+    def test_headless(self):
+        """Import and run without the geometry dependencies."""
+        script = (
+            "import sys\n"
+            "sys.modules['pyoccad'] = sys.modules['OCC'] = None\n"
+            "from pyturbo.systems.turbofan import Turbofan\n"
+            "tf = Turbofan('tf')\n"
+            "tf.run_once()\n"
+            "assert tf.occ_view.shapes == {}\n"
+        )
+        subprocess.run([executable, "-c", script], check=True)
+
     def test_cfm56(self):
         """Calibration of CMF56-7 turbofan."""
         # Create a new turbofan system
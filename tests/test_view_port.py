@@ -1,11 +1,16 @@
 # Copyright (C) 2024, twiinIT
 # SPDX-License-Identifier: BSD-3-Clause
 
+import pickle
+from copy import deepcopy
+
+import numpy as np
+import pytest
 from cosapp.base import System
 from pyoccad.render.threejs import Renderer
 
-from pyturbo.ports.frame_port import FramePort
-from pyturbo.ports.view_port import ViewPort
+from pyturbo.ports.frame_port import Frame, FramePort
+from pyturbo.ports.view_port import View, ViewPort
 from pyturbo.utils import create_cylinder, create_sphere
 
 
@@ -33,6 +38,25 @@ class SystemComponent(System):
         self.view.set_value(self.view1.get_value().merge(self.view2.get_value()))
 
 
+class SystemInput(System):
+    """System with a view input."""
+
+    def setup(self):
+        self.add_input(ViewPort, "view")
+
+
+class SystemAssembly(System):
+    """System for sibling view transfers."""
+
+    def setup(self):
+        self.add_input(FramePort, "s1_frame")
+        self.add_input(FramePort, "s2_frame")
+
+        self.add_child(SystemView("s1"))
+        self.add_child(SystemInput("s2"))
+        self.connect(self.s1.view, self.s2.view)
+
+
 def test_setup():
     """Test system setup."""
     assert SystemView("sys")
@@ -55,6 +79,63 @@ def test_copy_view():
     assert view2.shapes.keys() == sys.s1.view.get_value().shapes.keys()
 
 
+def test_copy_on_write():
+    """Test that transformations compose placements instead of copying shapes."""
+    view = View({"cyl": {"shape": create_cylinder(1.0, 2.0), "face_color": "red"}})
+    shape = view.shapes["cyl"]["shape"]
+
+    moved = view.translate((1.0, 0.0, 0.0), inplace=False).rotate((0.0, 0.0, np.pi / 2))
+    assert "placement" not in view.shapes["cyl"]
+    assert moved.shapes["cyl"]["shape"] is shape
+    assert moved.shapes["cyl"]["placement"][:3, 3] == pytest.approx([0.0, 1.0, 0.0])
+
+    frame = Frame()
+    frame.position = np.r_[1.0, 2.0, 3.0]
+    frame.angle = np.r_[0.0, 0.0, 0.5]
+    back = view.change_from_frame(frame).change_to_frame(frame)
+    assert back.shapes["cyl"]["placement"] == pytest.approx(np.eye(4))
+
+    shapes = moved.materialize().shapes
+    assert list(shapes["cyl"]) == ["shape", "face_color"]
+    assert shapes["cyl"]["shape"] is not shape
+
+
+def test_deepcopy():
+    """Test that deep copies keep the shapes and serialization drops them."""
+    sys = SystemComponent("sys")
+    shape = create_cylinder(1.0, 2.0)
+    sys.s1.view.set_value(View({"cyl": {"shape": shape}}).translate((1.0, 0.0, 0.0)))
+
+    copy = deepcopy(sys)
+    options = copy.s1.view.shapes["cyl"]
+    assert options["shape"] is shape
+    assert options["placement"] is not sys.s1.view.shapes["cyl"]["placement"]
+    assert options["placement"][:3, 3] == pytest.approx([1.0, 0.0, 0.0])
+    assert copy.s1.view.owner is copy.s1
+
+    assert pickle.loads(pickle.dumps(sys)).s1.view.shapes == {}
+    assert sys.s1.view.shapes["cyl"]["shape"] is shape
+
+
+def test_frame_transfer():
+    """Test the frame changes of view transfers."""
+    sys = SystemComponent("sys")
+    sys.s1.view.set_value(View({"cyl": {"shape": create_cylinder(1.0, 2.0)}}))
+    sys.s1_frame.position = np.r_[1.0, 0.0, 0.0]
+    sys.run_once()
+
+    assert sys.view1.shapes["cyl"]["placement"][:3, 3] == pytest.approx([1.0, 0.0, 0.0])
+
+    sys = SystemAssembly("sys")
+    sys.s1.view.set_value(View({"cyl": {"shape": create_cylinder(1.0, 2.0)}}))
+    sys.s1_frame.position = np.r_[1.0, 0.0, 0.0]
+    sys.s2_frame.angle = np.r_[0.0, 0.0, np.pi / 2.0]
+    sys.run_once()
+
+    expected = sys.s2_frame.get_value().inv().matrix @ sys.s1_frame.get_value().matrix
+    assert sys.s2.view.shapes["cyl"]["placement"] == pytest.approx(expected)
+
+
 def test_merge():
     """Test the merging of two view object."""
     sys = SystemComponent("sys")
@@ -76,6 +157,24 @@ def test_merge():
     assert "first.cyl" in view3.shapes.keys()  # custom prefixes
 
 
+def test_from_views():
+    """Test the single pass merging of named views."""
+    v1 = View(
+        {
+            "cyl": {"shape": create_cylinder(1.0, 2.0)},
+            "sph": {"shape": create_sphere(1.0, (0.0, 0.0, 0.0))},
+        }
+    )
+    v2 = View({"cyl": {"shape": create_cylinder(2.0, 2.0)}})
+
+    view = View.from_views({"first": v1, "second": v2})
+    assert list(view.shapes) == ["first.cyl", "first.sph", "second.cyl"]
+    assert view.shapes["second.cyl"] is v2.shapes["cyl"]
+
+    view = View.from_views({"module": view})
+    assert list(view.shapes) == ["module.first.cyl", "module.first.sph", "module.second.cyl"]
+
+
 def test_view_render():
     """Test the rendering of view object."""
     sys = SystemComponent("sys")
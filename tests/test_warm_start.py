@@ -0,0 +1,93 @@
+# Copyright (C) 2022-2023, twiinIT
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+from cosapp.systems import System
+
+from pyturbo.utils import WarmStartCache, solver_unknowns
+
+from .engines import cfm56
+
+
+class Linear(System):
+    def setup(self):
+        self.add_inward("x", 0.0)
+        self.add_inward("u", 0.0)
+        self.add_inward("v", np.zeros(2))
+
+
+class TestWarmStartCache:
+    """Define tests for the warm start cache of solver unknowns."""
+
+    def fill(self, cache):
+        s = Linear("s")
+        for x in [0.0, 1.0, 2.0]:
+            s.x = x
+            s.u = 10.0 * x
+            s.v = np.r_[x, -x]
+            cache.store(s)
+        return s
+
+    def test_nearest(self):
+        cache = WarmStartCache(["x"], ["u", "v"])
+        s = self.fill(cache)
+
+        s.x = 1.2
+        assert cache.apply(s)
+        assert s.u == 10.0
+        assert s.v == pytest.approx([1.0, -1.0])
+
+    def test_interpolate(self):
+        cache = WarmStartCache(["x"], ["u"], neighbors=2)
+        s = self.fill(cache)
+
+        s.x = 1.25
+        cache.apply(s)
+        assert s.u == pytest.approx(12.5)
+
+    def test_eviction(self):
+        cache = WarmStartCache(["x"], ["u"], maxsize=2)
+        s = self.fill(cache)
+
+        assert len(cache) == 2
+        s.x = -1.0
+        cache.apply(s)
+        assert s.u == 10.0
+
+    def test_save_load(self, tmp_path):
+        cache = WarmStartCache(["x"], ["u", "v"])
+        s = self.fill(cache)
+        cache.save(tmp_path / "cache.json")
+
+        loaded = WarmStartCache.load(tmp_path / "cache.json")
+        s.x = 2.1
+        loaded.apply(s)
+
+        assert len(loaded) == 3
+        assert s.u == 20.0
+        assert s.v == pytest.approx([2.0, -2.0])
+
+    def test_empty(self):
+        assert not WarmStartCache(["x"]).apply(Linear("s"))
+
+    def test_turbofan(self):
+        sys = cfm56()
+        sys.run_drivers()
+        cache = WarmStartCache(["altitude", "fuel_W"])
+        assert cache.store(sys)
+        assert cache.unknowns == solver_unknowns(sys)
+
+        cold = cfm56()
+        cold.fuel_W = 0.95
+        cold.run_drivers()
+
+        warm = cfm56()
+        warm.fuel_W = 0.95
+        cache.apply(warm)
+        warm.run_drivers()
+
+        cold_calls = cold.drivers["solver"].results.fres_calls
+        warm_calls = warm.drivers["solver"].results.fres_calls
+        assert warm_calls < cold_calls
+        assert warm.thrust == pytest.approx(cold.thrust, rel=1e-4)